@@ -0,0 +1,272 @@
+# benchmarks.py
+"""Benchmarks for template loading, generation, favorites and rendering.
+
+Usage:
+    python benchmarks.py                                  # quick sizes, print a table
+    python benchmarks.py --full --output results.json     # 1k-1M templates, 10-1M favorites
+    python benchmarks.py --baseline results.json --threshold 0.25
+    python benchmarks.py --headless                       # render through headless_ctk (no display needed)
+
+Each case runs on a synthetic corpus and reports the median of several runs.
+With ``--baseline`` the run fails (exit status 1) if any case's median is more
+than ``threshold`` (and at least ``--noise-floor-ms``) slower than in the
+baseline file. A baseline recorded with different repeats, headless mode or
+Python version is refused (exit status 2) unless ``--allow-mismatch`` is given.
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import headless_ctk
+import main
+from favorites_store import FavoritesStore, encode_records
+from generator import IdeaGenerator
+from records import IdeaRecord
+
+# --- Constants ---
+QUICK_TEMPLATE_SIZES = (1000, 10000, 100000)
+FULL_TEMPLATE_SIZES = (1000, 10000, 100000, 1000000)
+QUICK_FAVORITE_SIZES = (10, 1000, 10000)
+FULL_FAVORITE_SIZES = (10, 1000, 100000, 1000000)
+DISPLAY_FAVORITE_SIZES = (10, 100, 1000) # Widget rendering gets slow long before the file does
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 0.25 # 25% slower than baseline counts as a regression
+NOISE_FLOOR_MS = 0.05 # Slowdowns smaller than this are timer jitter, whatever the percentage
+COMPARABLE_META = ("repeats", "headless", "python") # Baselines must match these to be compared
+
+TEMPLATE_SHAPES = (
+    "How to Get Started with {keyword} Step-by-Step #{i}",
+    "Top {number} Tips for Mastering {keyword} in {year} #{i}",
+    "Is {topic} Still Worth It for [Target Audience]? #{i}",
+    "{keyword} vs {competitor_placeholder}: Which Helps You {benefit}? #{i}",
+    "A Plain Template Without Placeholders #{i}",
+)
+
+
+# --- Synthetic Corpora ---
+def make_templates(count, categories=10):
+    """Returns a categorized template dict holding ``count`` distinct templates."""
+    templates = {f"category_{c}": [] for c in range(categories)}
+    for i in range(count):
+        shape = TEMPLATE_SHAPES[i % len(TEMPLATE_SHAPES)]
+        templates[f"category_{i % categories}"].append(shape.replace("#{i}", f"#{i}"))
+    return templates
+
+
+def make_favorites(count):
+    return [IdeaRecord(f"Favorite idea number {i} about keyword {i % 97}", f"keyword {i % 97}",
+                       f"category_{i % 10}:{i}", f"category_{i % 10}", 1700000000 + i)
+            for i in range(count)]
+
+
+class _Host:
+    """Stand-in ``self`` for calling IdeaGeneratorApp methods that need no widgets."""
+
+    def __init__(self, templates=None):
+        self.all_templates = templates or []
+        self.generator = IdeaGenerator(self.all_templates)
+
+
+# --- Timing ---
+@contextlib.contextmanager
+def _quiet():
+    """Silences the app's debug prints so they don't dominate small timings."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def measure(func, setup=None, repeats=DEFAULT_REPEATS):
+    """Runs ``setup`` (untimed) then ``func`` (timed) ``repeats`` times after one warm-up."""
+    timings = []
+    for run in range(repeats + 1):
+        if setup is not None:
+            setup()
+        with _quiet():
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+        if run > 0:
+            timings.append(elapsed)
+    return {"median_s": statistics.median(timings), "min_s": min(timings), "repeats": repeats}
+
+
+# --- Benchmark Cases ---
+def bench_templates(size, tmp_dir, repeats):
+    template_data = make_templates(size)
+    path = os.path.join(tmp_dir, f"templates_{size}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(template_data, f)
+
+    host = _Host()
+    yield "load_json_data", measure(lambda: main.IdeaGeneratorApp._load_json_data(host, path), repeats=repeats)
+    yield "flatten_templates", measure(lambda: main.IdeaGeneratorApp._flatten_templates(host, template_data), repeats=repeats)
+
+    with _quiet():
+        host = _Host(main.IdeaGeneratorApp._flatten_templates(host, template_data))
+    generate = lambda: main.IdeaGeneratorApp._perform_generation(host, "content marketing")
+    yield "perform_generation", measure(generate, setup=host.generator._cache.clear, repeats=repeats)
+    yield "perform_generation_cached", measure(generate, repeats=repeats)
+
+
+def bench_favorites(size, tmp_dir, repeats):
+    path = os.path.join(tmp_dir, f"favorites_{size}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(encode_records(make_favorites(size)))
+    store = FavoritesStore(path)
+    yield "favorites_load", measure(store.load, repeats=repeats)
+
+    record = IdeaRecord("A brand new favorite", "benchmark", "bench:0", "bench")
+    yield "favorites_add_save", measure(lambda: store.add(record), setup=lambda: store.remove(record), repeats=repeats)
+    yield "favorites_remove_save", measure(lambda: store.remove(record), setup=lambda: store.add(record), repeats=repeats)
+
+
+def make_app(tmp_dir, headless=False):
+    """Creates the app in ``tmp_dir`` or returns (None, reason) when Tk cannot start.
+
+    With ``headless`` the app runs on headless_ctk, which times widget work
+    without drawing anything, so results are not comparable with real Tk runs.
+    """
+    cwd = os.getcwd()
+    os.chdir(tmp_dir) # The app reads and writes its data files relative to the working directory
+    try:
+        app_module = headless_ctk.load_app() if headless else main
+        with _quiet():
+            app = app_module.IdeaGeneratorApp()
+            app.withdraw()
+        return app, None
+    except Exception as e: # tkinter.TclError without a display
+        return None, f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+    finally:
+        os.chdir(cwd)
+
+
+def bench_display(app, size, repeats):
+    favorites = make_favorites(size)
+
+    def display():
+        app._display_favorites()
+        app.update_idletasks()
+
+    yield "display_favorites", measure(display, setup=lambda: app.favorites.__setitem__(slice(None), favorites),
+                                       repeats=repeats)
+
+
+# --- Runner ---
+def run(template_sizes, favorite_sizes, display_sizes, repeats, headless=False):
+    results = []
+
+    def record(name, size, stats):
+        results.append({"name": name, "size": size, **stats})
+        print(f"{name:<28}{size:>10,}  median {stats['median_s'] * 1000:>11.3f}ms  min {stats['min_s'] * 1000:>11.3f}ms")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in template_sizes:
+            for name, stats in bench_templates(size, tmp_dir, repeats):
+                record(name, size, stats)
+        for size in favorite_sizes:
+            for name, stats in bench_favorites(size, tmp_dir, repeats):
+                record(name, size, stats)
+
+        if display_sizes:
+            app, reason = make_app(tmp_dir, headless)
+            if app is None:
+                print(f"Skipping display benchmarks: {reason} (use --headless to run them without a display)")
+            else:
+                for size in display_sizes:
+                    for name, stats in bench_display(app, size, repeats):
+                        record(name + ("_headless" if headless else ""), size, stats)
+                app.destroy()
+    return results
+
+
+def meta_mismatches(meta, baseline):
+    """Returns the run settings that differ from the baseline's, which make timings incomparable."""
+    before = baseline.get("meta", {})
+    return [f"{key}: baseline {before.get(key)!r}, this run {meta.get(key)!r}"
+            for key in COMPARABLE_META if before.get(key) != meta.get(key)]
+
+
+def compare(results, baseline, threshold, noise_floor_ms=NOISE_FLOOR_MS):
+    """Returns a description of every case that regressed past ``threshold`` versus ``baseline``.
+
+    A case must also be at least ``noise_floor_ms`` slower in absolute terms,
+    so sub-millisecond cases cannot fail on jitter alone.
+    """
+    previous = {(r["name"], r["size"]): r["median_s"] for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous.get((result["name"], result["size"]))
+        if (before and result["median_s"] > before * (1 + threshold)
+                and (result["median_s"] - before) * 1000 >= noise_floor_ms):
+            regressions.append(f"{result['name']} @ {result['size']:,}: {before * 1000:.3f}ms -> "
+                               f"{result['median_s'] * 1000:.3f}ms (+{(result['median_s'] / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def _sizes(text):
+    return tuple(int(part) for part in text.split(",") if part.strip())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--full", action="store_true", help="Use the large sizes (up to 1M templates and favorites)")
+    parser.add_argument("--templates", type=_sizes, help="Comma-separated template corpus sizes")
+    parser.add_argument("--favorites", type=_sizes, help="Comma-separated favorites file sizes")
+    parser.add_argument("--display", type=_sizes, default=DISPLAY_FAVORITE_SIZES,
+                        help="Comma-separated favorites counts to render (empty to skip)")
+    parser.add_argument("--headless", action="store_true", help="Run display benchmarks on headless_ctk")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Results JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown versus baseline as a fraction (default: 0.25)")
+    parser.add_argument("--noise-floor-ms", type=float, default=NOISE_FLOOR_MS,
+                        help="Ignore slowdowns smaller than this many milliseconds (default: 0.05)")
+    parser.add_argument("--allow-mismatch", action="store_true",
+                        help="Compare even if the baseline used different repeats, headless mode or Python")
+    args = parser.parse_args()
+
+    template_sizes = args.templates or (FULL_TEMPLATE_SIZES if args.full else QUICK_TEMPLATE_SIZES)
+    favorite_sizes = args.favorites or (FULL_FAVORITE_SIZES if args.full else QUICK_FAVORITE_SIZES)
+    results = run(template_sizes, favorite_sizes, args.display, args.repeats, args.headless)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": args.repeats,
+            "headless": args.headless,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        mismatches = meta_mismatches(report["meta"], baseline)
+        if mismatches:
+            print(f"{'WARNING' if args.allow_mismatch else 'ERROR'}: baseline was recorded with different settings:")
+            for line in mismatches:
+                print(f"  {line}")
+            if not args.allow_mismatch:
+                print("Re-record the baseline with the same settings, or pass --allow-mismatch.")
+                sys.exit(2)
+        regressions = compare(results, baseline, args.threshold, args.noise_floor_ms)
+        if regressions:
+            print(f"FAIL: {len(regressions)} case(s) regressed more than {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"PASS: no case regressed more than {args.threshold:.0%}.")
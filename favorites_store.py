@@ -0,0 +1,172 @@
+# favorites_store.py
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl  # POSIX advisory locks
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from records import IdeaRecord
+
+# --- Constants ---
+FAVORITES_FILE = 'favorites.json'
+
+
+def encode_records(records):
+    """Serializes records as a JSON list with one compact record per line."""
+    if not records:
+        return "[]\n"
+    lines = (json.dumps(record.to_json(), ensure_ascii=False, separators=(',', ':')) for record in records)
+    return "[\n" + ",\n".join(lines) + "\n]\n"
+
+
+# --- Shared Favorites Store ---
+class FavoritesStore:
+    """Favorites list backed by a JSON file that several processes may share.
+
+    Every change is applied as a locked read-modify-write against the current
+    file contents, so additions and removals made by other instances are merged
+    instead of overwritten. The file itself is replaced atomically and guarded
+    by an advisory lock on a sidecar ``.lock`` file.
+
+    Favorites are held as IdeaRecords and stored one compact JSON array per
+    line. Files from older versions (a list of plain strings) are migrated
+    the first time they are loaded.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.lock_path = filepath + ".lock"
+        self.items = []  # Mutated in place so callers can hold a reference
+        self._signature = None
+
+    # --- Locking ---
+    @contextmanager
+    def _locked(self):
+        """Holds an exclusive advisory lock for the duration of the block."""
+        with open(self.lock_path, 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    # --- File Access (call with the lock held) ---
+    def _file_signature(self):
+        try:
+            st = os.stat(self.filepath)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _read_raw(self):
+        """Returns the decoded JSON list on disk. Raises ValueError if the file is corrupt."""
+        if not os.path.exists(self.filepath):
+            return []
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError(f"Expected a list in {self.filepath}, got {type(data).__name__}")
+        return data
+
+    def _read(self):
+        """Returns the favorites currently on disk as IdeaRecords."""
+        return self._decode_all(self._read_raw())
+
+    def _decode_all(self, raw):
+        return [record for record in map(self._decode, raw) if record is not None]
+
+    def _decode(self, entry):
+        """Returns the IdeaRecord for ``entry``, or None (with a warning) if it cannot be decoded."""
+        try:
+            return IdeaRecord.from_json(entry)
+        except ValueError:
+            text = entry[0] if isinstance(entry, list) and entry else entry.get('text') if isinstance(entry, dict) else None
+            if not isinstance(text, str):
+                print(f"[WARN] Skipping undecodable favorite {str(entry)[:50]!r} in {self.filepath}")
+                return None
+            # Keep the idea itself from an entry whose provenance fields are invalid
+            print(f"[WARN] Dropping invalid fields from favorite '{text[:50]}' in {self.filepath}")
+            return IdeaRecord(text, created_at=0)
+
+    def _write(self, data):
+        """Atomically replaces the favorites file with ``data``."""
+        directory = os.path.dirname(os.path.abspath(self.filepath))
+        fd, tmp_path = tempfile.mkstemp(prefix='.favorites-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(encode_records(data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _sync(self, data):
+        self.items[:] = data
+        self._signature = self._file_signature()
+
+    # --- Public API ---
+    def load(self):
+        """Loads the favorites from disk and returns the shared ``items`` list."""
+        with self._locked():
+            raw = self._read_raw()
+            data = self._decode_all(raw)
+            if any(isinstance(entry, str) for entry in raw):
+                print(f"[DEBUG] Migrating {self.filepath} to the record format.") # DEBUG PRINT
+                self._write(data)
+            self._sync(data)
+        return self.items
+
+    def refresh_if_changed(self):
+        """Reloads the favorites if another process changed the file. Returns True if it did."""
+        signature = self._file_signature()
+        if signature == self._signature:
+            return False
+        with self._locked():
+            try:
+                data = self._read()
+            except (OSError, ValueError):
+                self._signature = signature # Report a corrupt file once, not on every poll
+                raise
+            self._sync(data)
+        return True
+
+    def add(self, item):
+        """Adds the IdeaRecord ``item`` unless its text is present. Returns False if it was already a favorite."""
+        with self._locked():
+            current = self._read()
+            if item in current:
+                self._sync(current)
+                return False
+            current.append(item)
+            self._write(current)
+            self._sync(current)
+        return True
+
+    def remove(self, item):
+        """Removes the favorite with ``item``'s text if present. Returns False if it was not a favorite."""
+        with self._locked():
+            current = self._read()
+            if item not in current:
+                self._sync(current)
+                return False
+            current.remove(item)
+            self._write(current)
+            self._sync(current)
+        return True
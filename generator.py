@@ -0,0 +1,199 @@
+# generator.py
+"""Idea generation logic shared by the desktop app and the HTTP service."""
+import datetime
+import json
+import os
+import random
+import re
+import time
+from collections import OrderedDict
+
+from placeholders import placeholder_name, shared_registry
+from records import IdeaRecord
+
+# --- Constants ---
+TEMPLATES_FILE = 'templates.json'
+DEFAULT_NUMBER = 5 # Default number for listicles etc.
+GENERATION_CACHE_SIZE = 128 # Keywords whose rendered ideas are kept for reuse
+FIXED_FIELDS = ("keyword", "topic", "year", "number") # Same value for every idea of a keyword
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}|\[([^\[\]{}]+)\]") # {name} or [Label e.g., Example]
+
+# --- Default Templates Structure (Used as fallback and for initial creation) ---
+DEFAULT_TEMPLATES = {
+  "howto": [
+    "How to Get Started with {keyword} Step-by-Step",
+    "A Beginner's Guide to Understanding {topic}",
+    "How to Effectively Use {keyword} for Small Businesses"
+  ],
+  "listicle": [
+    "Top {number} Tips for Mastering {keyword} in {year}",
+    "{number} Common Mistakes to Avoid with {topic}",
+    "The {number} Essential Tools for Anyone Using {keyword}"
+  ],
+  "questions": [
+    "What Exactly Is {topic} and Why Does It Matter?",
+    "Is {keyword} Still a Valuable Skill in {year}?",
+    "How Can {topic} Improve [Specific Outcome e.g., Customer Engagement]?"
+  ],
+  "guides": [
+    "The Ultimate {year} Guide to {topic}",
+    "Everything You Need to Know About {keyword}"
+  ]
+}
+
+
+def load_templates(filepath):
+    """Loads templates from a JSON file, falling back to the defaults on any error."""
+    if not os.path.exists(filepath):
+        print(f"[WARN] File '{filepath}' not found. Using default templates.")
+        return json.loads(json.dumps(DEFAULT_TEMPLATES)) # Return copy
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"[ERROR] Error loading {filepath}: {e}. Using default templates.")
+        return json.loads(json.dumps(DEFAULT_TEMPLATES)) # Return copy
+
+
+def flatten_templates(template_data):
+    """Converts categorized templates into a single list of ``(template_id, category, template)``."""
+    flat_list = []
+    if isinstance(template_data, dict):
+        for category, category_list in template_data.items():
+            if isinstance(category_list, list):
+                flat_list.extend((f"{category}:{i}", category, template) for i, template in enumerate(category_list))
+            else:
+                print(f"[WARN] Expected list for template category '{category}', got {type(category_list)}")
+    elif isinstance(template_data, list):
+        flat_list = [(str(i), None, template) for i, template in enumerate(template_data)]
+    else:
+        print(f"[WARN] Template data is not a dict or list, type is {type(template_data)}")
+    return flat_list
+
+
+class _TemplateValues(dict):
+    """Placeholder values; provider placeholders get a fresh pick per use, unknown ones render unchanged."""
+    def __init__(self, base, providers):
+        super().__init__(base)
+        self.providers = providers
+
+    def __missing__(self, key):
+        provider = self.providers.get(key)
+        value = provider.pick() if provider is not None else None
+        return "{" + key + "}" if value is None else value
+
+
+def _escape(text):
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def compile_template(template, registry=None):
+    """Converts a template into a ``str.format_map`` string and the placeholder names it uses.
+
+    ``{name}`` placeholders always become fields. ``[Label]`` placeholders only do
+    when ``registry`` has a provider with data for them; otherwise they stay
+    literal text. Everything else is escaped, so stray braces in a template
+    render literally, as they did before templates were compiled.
+    """
+    parts, names, end = [], [], 0
+    for match in PLACEHOLDER_PATTERN.finditer(template):
+        parts.append(_escape(template[end:match.start()]))
+        end = match.end()
+        brace_name, label = match.groups()
+        if brace_name is not None and not brace_name.isdigit(): # Numeric fields would be positional
+            name = brace_name
+        elif label is not None and registry is not None:
+            name = placeholder_name(label)
+            provider = registry.get(name) if name else None
+            if provider is None or not provider.values(): # Loads (once) only providers templates use
+                name = None
+        else:
+            name = None
+        if name is None:
+            parts.append(_escape(match.group(0)))
+        else:
+            names.append(name)
+            parts.append("{" + name + "}")
+    parts.append(_escape(template[end:]))
+    return "".join(parts), tuple(names)
+
+
+# --- Generator ---
+class IdeaGenerator:
+    """Fills pre-compiled templates, caching the rendered ideas per keyword.
+
+    Templates are compiled to format strings once, up front, so rendering an
+    idea is a single ``format_map`` call. Ideas from templates with only fixed
+    fields (keyword, year, ...) are cached per keyword in an LRU cache; templates
+    that use a placeholder provider are rendered afresh on every pass so each
+    generation picks new values. ``iter_ideas`` streams ideas lazily so callers
+    can show the first few before the rest are rendered.
+    """
+
+    def __init__(self, templates, registry=None, cache_size=GENERATION_CACHE_SIZE):
+        self.registry = registry if registry is not None else shared_registry()
+        compiled = []
+        referenced = set()
+        for template_id, category, template in templates:
+            if isinstance(template, str):
+                fmt, names = compile_template(template, self.registry)
+                compiled.append((template_id, category, fmt if names else None, template, names))
+                referenced.update(names)
+            else:
+                print(f"[ERROR] Skipping template '{template_id}': expected a string, got {type(template)}")
+        # Only providers some template uses take part in generation, however many are registered
+        self.providers = {name: self.registry.get(name) for name in referenced
+                          if name not in FIXED_FIELDS and name in self.registry}
+        # Providers without data always give their fallback, so only ones with values vary per pass
+        varying = {name for name, provider in self.providers.items() if provider.values()}
+        # (template_id, category, format string or None if no placeholders, literal text, uses a varying provider)
+        self.compiled = [(template_id, category, fmt, literal, any(name in varying for name in names))
+                         for template_id, category, fmt, literal, names in compiled]
+        self.cache_size = cache_size
+        self._cache = OrderedDict() # (keyword, year) -> text per compiled template, None where it uses a provider
+
+    def __len__(self):
+        return len(self.compiled)
+
+    def _values(self, keyword, year):
+        return _TemplateValues({
+            "keyword": keyword, "topic": keyword, "year": year, "number": DEFAULT_NUMBER
+        }, self.providers)
+
+    def iter_ideas(self, keyword):
+        """Yields unique IdeaRecords for ``keyword`` in template order, rendering only as far as consumed."""
+        year = datetime.datetime.now().year
+        created_at = int(time.time())
+        cache_key = (keyword, year)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            try:
+                self._cache.move_to_end(cache_key)
+            except KeyError:
+                pass # Evicted by another thread sharing this generator (thread-mode server)
+
+        values = self._values(keyword, year)
+        texts = [] # Fixed-field texts for the cache, filled on an uncached pass
+        seen = set() # The first template to produce a text wins
+        for index, (template_id, category, fmt, literal, uses_provider) in enumerate(self.compiled):
+            if cached is not None and not uses_provider:
+                text = cached[index]
+            else:
+                text = fmt.format_map(values) if fmt is not None else literal
+                if cached is None:
+                    texts.append(None if uses_provider else text)
+            if text not in seen:
+                seen.add(text)
+                yield IdeaRecord(text, keyword, template_id, category, created_at)
+
+        # Only reached when the caller consumed everything, so partial passes are never cached
+        if cached is None:
+            self._cache[cache_key] = texts
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def generate(self, keyword):
+        """Returns all unique IdeaRecords for ``keyword`` in random order."""
+        generated = list(self.iter_ideas(keyword))
+        random.shuffle(generated)
+        return generated
@@ -0,0 +1,339 @@
+# headless_ctk.py
+"""Stand-in for ``customtkinter`` that runs the app's GUI code without a display.
+
+Widgets keep just enough state for IdeaGeneratorApp (text, children, bindings,
+commands) and report every creation and destruction to ``stats``, with timings.
+``after()`` callbacks run on a virtual clock advanced by ``CTk.advance``.
+
+    import headless_ctk
+    main = headless_ctk.load_app()          # a copy of main.py bound to this module
+    app = main.IdeaGeneratorApp()
+    app.keyword_entry.insert(0, "seo")
+    app.generate_button.invoke()
+    print(headless_ctk.stats.live_total())
+"""
+import heapq
+import importlib.util
+import itertools
+import os
+import sys
+import time
+from collections import Counter
+
+# --- Widget Statistics ---
+class WidgetStats:
+    """Counts and times widget creation and destruction, per widget class."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.created = Counter()
+        self.destroyed = Counter()
+        self.create_seconds = Counter()
+        self.destroy_seconds = Counter()
+
+    def live(self):
+        return {name: self.created[name] - self.destroyed[name]
+                for name in self.created if self.created[name] != self.destroyed[name]}
+
+    def live_total(self):
+        return sum(self.created.values()) - sum(self.destroyed.values())
+
+    def summary(self):
+        return {
+            name: {
+                "created": self.created[name],
+                "destroyed": self.destroyed[name],
+                "live": self.created[name] - self.destroyed[name],
+                "create_ms": round(self.create_seconds[name] * 1000, 3),
+                "destroy_ms": round(self.destroy_seconds[name] * 1000, 3),
+            }
+            for name in sorted(self.created)
+        }
+
+
+stats = WidgetStats()
+
+
+class Event:
+    """Minimal stand-in for ``tkinter.Event``."""
+
+    def __init__(self, widget=None, keysym="", char=""):
+        self.widget = widget
+        self.keysym = keysym
+        self.char = char
+
+
+class MessageRecorder:
+    """Replaces ``tkinter.messagebox`` in a headless app; records instead of showing dialogs."""
+
+    def __init__(self):
+        self.calls = []
+
+    def _record(kind):
+        def show(self, title=None, message=None, **options):
+            self.calls.append((kind, title, message))
+            return "ok"
+        return show
+
+    showinfo = _record("info")
+    showwarning = _record("warning")
+    showerror = _record("error")
+    del _record
+
+    def errors(self):
+        return [call for call in self.calls if call[0] == "error"]
+
+
+# --- Widgets ---
+class _Widget:
+    def __init__(self, master=None, **kwargs):
+        started = time.perf_counter()
+        self.master = master
+        self._options = dict(kwargs)
+        self._children = []
+        self._bindings = {}
+        self._manager = None # "pack", "grid" or "place" while mapped
+        self._destroyed = False
+        if master is not None:
+            master._children.append(self)
+        name = type(self).__name__
+        stats.created[name] += 1
+        stats.create_seconds[name] += time.perf_counter() - started
+
+    # --- Lifecycle ---
+    def destroy(self):
+        if self._destroyed:
+            return
+        started = time.perf_counter()
+        for child in list(self._children):
+            child.destroy()
+        if self.master is not None and self in self.master._children:
+            self.master._children.remove(self)
+        self._destroyed = True
+        self._bindings.clear()
+        self._options.clear()
+        name = type(self).__name__
+        stats.destroyed[name] += 1
+        stats.destroy_seconds[name] += time.perf_counter() - started
+
+    def winfo_exists(self):
+        return not self._destroyed
+
+    def winfo_children(self):
+        return list(self._children)
+
+    def winfo_ismapped(self):
+        return self._manager is not None
+
+    # --- Options ---
+    def configure(self, **kwargs):
+        self._options.update(kwargs)
+
+    config = configure
+
+    def cget(self, option):
+        return self._options.get(option)
+
+    # --- Geometry ---
+    def pack(self, **kwargs):
+        self._manager = "pack"
+
+    def grid(self, **kwargs):
+        self._manager = "grid"
+
+    def place(self, **kwargs):
+        self._manager = "place"
+
+    def pack_forget(self):
+        self._manager = None
+
+    grid_forget = place_forget = pack_forget
+
+    def grid_columnconfigure(self, index, **kwargs):
+        pass
+
+    grid_rowconfigure = grid_columnconfigure
+
+    def lift(self, *args):
+        pass
+
+    # --- Events ---
+    def bind(self, sequence=None, command=None, add=True):
+        self._bindings.setdefault(sequence, []).append(command)
+
+    def fire(self, sequence, **event_fields):
+        """Invokes the handlers bound to ``sequence`` as Tk would for a real event."""
+        event = Event(widget=self, **event_fields)
+        for command in list(self._bindings.get(sequence, [])):
+            command(event)
+
+
+class CTkFrame(_Widget):
+    pass
+
+
+class CTkScrollableFrame(CTkFrame):
+    pass
+
+
+class CTkLabel(_Widget):
+    pass
+
+
+class CTkButton(_Widget):
+    def invoke(self):
+        command = self._options.get("command")
+        if command is not None:
+            return command()
+
+
+class CTkSwitch(_Widget):
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self._on = False
+
+    def get(self):
+        return 1 if self._on else 0
+
+    def select(self):
+        self._on = True
+
+    def deselect(self):
+        self._on = False
+
+    def toggle(self):
+        self._on = not self._on
+        command = self._options.get("command")
+        if command is not None:
+            command()
+
+
+class CTkEntry(_Widget):
+    def __init__(self, master=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self._text = ""
+
+    def get(self):
+        return self._text
+
+    def _index(self, index):
+        return len(self._text) if index in ("end", None) else int(index)
+
+    def delete(self, first, last=None):
+        start = self._index(first)
+        end = start + 1 if last is None else self._index(last)
+        self._text = self._text[:start] + self._text[end:]
+
+    def insert(self, index, text):
+        index = self._index(index)
+        self._text = self._text[:index] + text + self._text[index:]
+
+    def type_text(self, text):
+        """Appends ``text`` one character at a time, firing ``<KeyRelease>`` after each."""
+        for char in text:
+            self.insert("end", char)
+            self.fire("<KeyRelease>", keysym=char if char.isalnum() else "space", char=char)
+
+
+class CTk(_Widget):
+    """Root window with a virtual-clock ``after()`` queue."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(None, **kwargs)
+        self.now_ms = 0
+        self._queue = [] # (due_ms, sequence, after_id, func, args)
+        self._cancelled = set()
+        self._ids = itertools.count(1)
+        self.clipboard = ""
+
+    def title(self, text=None):
+        self._options["title"] = text
+
+    def geometry(self, spec=None):
+        self._options["geometry"] = spec
+
+    def after(self, ms, func=None, *args):
+        sequence = next(self._ids)
+        after_id = f"after#{sequence}"
+        heapq.heappush(self._queue, (self.now_ms + int(ms), sequence, after_id, func, args))
+        return after_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, after_id):
+        self._cancelled.add(after_id)
+
+    def pending_after(self):
+        return sum(1 for entry in self._queue if entry[2] not in self._cancelled)
+
+    def advance(self, ms):
+        """Moves the virtual clock forward, running every callback that falls due on the way."""
+        target = self.now_ms + ms
+        while self._queue and self._queue[0][0] <= target:
+            due_ms, _, after_id, func, args = heapq.heappop(self._queue)
+            self.now_ms = max(self.now_ms, due_ms)
+            if after_id in self._cancelled:
+                self._cancelled.discard(after_id)
+                continue
+            func(*args)
+        self.now_ms = target
+
+    def update(self):
+        self.advance(0)
+
+    def update_idletasks(self):
+        pass
+
+    def clipboard_clear(self):
+        self.clipboard = ""
+
+    def clipboard_append(self, text):
+        self.clipboard += text
+
+    def withdraw(self):
+        pass
+
+    def protocol(self, name=None, func=None):
+        self._options[f"protocol:{name}"] = func
+
+    def mainloop(self, n=0):
+        pass
+
+
+# --- Module-level customtkinter API ---
+def set_appearance_mode(mode):
+    pass
+
+
+def set_default_color_theme(theme):
+    pass
+
+
+def install():
+    """Registers this module as ``customtkinter``. Call before anything imports the real one."""
+    sys.modules["customtkinter"] = sys.modules[__name__]
+
+
+def load_app(path=None):
+    """Imports a private copy of main.py bound to this stand-in and returns it.
+
+    The real ``customtkinter`` (if already imported) is left untouched, and the
+    copy's ``messagebox`` is replaced by a MessageRecorder.
+    """
+    path = path or os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    previous = sys.modules.get("customtkinter")
+    sys.modules["customtkinter"] = sys.modules[__name__]
+    try:
+        spec = importlib.util.spec_from_file_location("headless_main", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if previous is not None:
+            sys.modules["customtkinter"] = previous
+        else:
+            del sys.modules["customtkinter"]
+    module.messagebox = MessageRecorder()
+    return module
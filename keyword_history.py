@@ -0,0 +1,288 @@
+# keyword_history.py
+"""Persistent keyword history with prefix autocomplete."""
+import heapq
+import json
+import os
+import tempfile
+import threading
+import time
+
+# --- Constants ---
+KEYWORD_HISTORY_FILE = 'keyword_history.jsonl'
+AUTOCOMPLETE_LIMIT = 8 # Suggestions kept per trie node and shown in the dropdown
+BURST_LIMIT = 64 # Keywords a leaf bucket holds before it is split into child nodes
+
+
+class _TrieNode:
+    __slots__ = ('children', 'bucket', 'top')
+
+    def __init__(self, bucket=None):
+        self.children = None # char -> _TrieNode once the node has burst
+        self.bucket = bucket if bucket is not None else [] # Keywords stored at this node
+        self.top = [] # Best-scored keywords in this subtree, best first
+
+
+class KeywordTrie:
+    """Burst trie over lowercase keywords that keeps the best completions at each node.
+
+    Prefixes that end on a trie node are answered from that node's ``top`` list.
+    Longer prefixes end in a leaf bucket of at most ``BURST_LIMIT`` keywords,
+    which is filtered directly. Either way a lookup touches a bounded amount of
+    data, independent of how many keywords are stored. Scores may only grow,
+    which is what lets ``top`` lists be maintained incrementally.
+    """
+
+    def __init__(self, score):
+        self._score = score # keyword -> comparable score
+        self.root = _TrieNode()
+
+    def _offer(self, node, keyword):
+        top = node.top
+        if keyword in top:
+            top.sort(key=self._score, reverse=True)
+        elif len(top) < AUTOCOMPLETE_LIMIT or self._score(keyword) > self._score(top[-1]):
+            top.append(keyword)
+            top.sort(key=self._score, reverse=True)
+            del top[AUTOCOMPLETE_LIMIT:]
+
+    def _burst(self, node, depth):
+        node.children = {}
+        remaining = []
+        for keyword in node.bucket:
+            key = keyword.lower()
+            if len(key) == depth:
+                remaining.append(keyword) # Ends exactly here
+            else:
+                child = node.children.get(key[depth])
+                if child is None:
+                    child = node.children[key[depth]] = _TrieNode()
+                child.bucket.append(keyword)
+        node.bucket = remaining
+        for child in node.children.values():
+            child.top = heapq.nlargest(AUTOCOMPLETE_LIMIT, child.bucket, key=self._score)
+
+    def add(self, keyword):
+        """Inserts ``keyword`` or, if present, re-ranks it after its score went up."""
+        key = keyword.lower()
+        node, depth = self.root, 0
+        while True:
+            self._offer(node, keyword)
+            if node.children is None or depth == len(key):
+                if keyword not in node.bucket:
+                    node.bucket.append(keyword)
+                    if node.children is None and len(node.bucket) > BURST_LIMIT:
+                        self._burst(node, depth)
+                return
+            child = node.children.get(key[depth])
+            if child is None:
+                child = node.children[key[depth]] = _TrieNode()
+            node, depth = child, depth + 1
+
+    def complete(self, prefix, limit=AUTOCOMPLETE_LIMIT):
+        """Returns up to ``limit`` stored keywords starting with ``prefix`` (case-insensitive), best first."""
+        key = prefix.lower()
+        node, depth = self.root, 0
+        while depth < len(key):
+            if node.children is None:
+                matches = [keyword for keyword in node.bucket if keyword.lower().startswith(key)]
+                return heapq.nlargest(limit, matches, key=self._score)
+            node = node.children.get(key[depth])
+            if node is None:
+                return []
+            depth += 1
+        return node.top[:limit]
+
+
+def _parse_journal_line(line):
+    """Returns ``(keyword, count, last_used)`` from a journal line, or None if it is torn or corrupt."""
+    try:
+        data = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(data, list) or len(data) != 3:
+        return None
+    keyword, count, last_used = data
+    if not isinstance(keyword, str) or not keyword:
+        return None
+    if any(not isinstance(value, int) or isinstance(value, bool) for value in (count, last_used)):
+        return None
+    return keyword, count, last_used
+
+
+class KeywordHistory:
+    """Keyword use counts and recency, persisted as an append-only JSON-lines journal.
+
+    Each generation appends ``[keyword, 1, timestamp]``; loading folds the journal
+    into totals and compacts it when it has grown well past one line per keyword.
+    ``load`` is meant to run off the UI thread; keywords recorded while it runs
+    are queued, both in memory and for the journal, and applied once it finishes.
+    """
+
+    def __init__(self, filepath=KEYWORD_HISTORY_FILE):
+        self.filepath = filepath
+        self.entries = {} # keyword -> [count, last_used]
+        self.trie = KeywordTrie(self._score)
+        self.loaded = False
+        self._lock = threading.Lock() # Guards the in-memory state; only ever held briefly
+        self._file_lock = threading.Lock() # Guards the journal file; load() holds it for the whole read
+        self._journal_read = False
+        self._pending = [] # Recorded after the journal was read but before loading finished
+        self._unwritten = [] # Journal lines waiting for the file lock
+
+    def _score(self, keyword):
+        count, last_used = self.entries[keyword]
+        return (count, last_used)
+
+    def _apply(self, entries, trie, keyword, count, last_used):
+        entry = entries.get(keyword)
+        if entry is None:
+            entries[keyword] = [count, last_used]
+        else:
+            entry[0] += count
+            entry[1] = max(entry[1], last_used)
+        trie.add(keyword)
+
+    def _append_lines(self, lines):
+        if not lines:
+            return
+        try:
+            with open(self.filepath, 'a', encoding='utf-8') as f:
+                f.writelines(lines)
+        except IOError as e:
+            print(f"[ERROR] Error saving {self.filepath}: {e}")
+
+    def _flush_journal(self, blocking=False):
+        """Appends queued lines to the journal.
+
+        Without ``blocking`` this gives up at once if load() holds the file, and
+        load() writes the lines when it is done, so record() never waits on a read.
+        """
+        while self._file_lock.acquire(blocking=blocking):
+            try:
+                with self._lock:
+                    lines, self._unwritten = self._unwritten, []
+                self._append_lines(lines)
+            finally:
+                self._file_lock.release()
+            with self._lock: # Lines queued while the file was held would otherwise wait for the next record()
+                if not self._unwritten:
+                    return
+
+    def load(self):
+        """Reads the journal and builds the trie. Safe to call from a worker thread."""
+        with self._file_lock:
+            with self._lock:
+                earlier, self._unwritten = self._unwritten, []
+                self._journal_read = True
+            self._append_lines(earlier) # Recorded before this read, so they belong in it
+            lines = []
+            if os.path.exists(self.filepath):
+                try:
+                    with open(self.filepath, 'r', encoding='utf-8') as f:
+                        lines = f.readlines()
+                except IOError as e:
+                    print(f"[ERROR] Error loading {self.filepath}: {e}")
+
+            entries = {}
+            trie = KeywordTrie(lambda keyword: tuple(entries[keyword]))
+            for line in lines:
+                parsed = _parse_journal_line(line)
+                if parsed is not None: # Skip a torn or corrupt line rather than losing the whole history
+                    self._apply(entries, trie, *parsed)
+
+            compact = len(lines) > 2 * len(entries) + 1000
+            with self._lock:
+                for keyword, last_used in self._pending:
+                    self._apply(entries, trie, keyword, 1, last_used)
+                self._pending = []
+                trie._score = self._score
+                self.entries = entries
+                self.trie = trie
+                self.loaded = True
+                if compact:
+                    # Everything queued so far is already counted in the snapshot
+                    snapshot = [(keyword, count, last_used) for keyword, (count, last_used) in entries.items()]
+                    self._unwritten = []
+            if compact:
+                self._compact(snapshot)
+        self._flush_journal(blocking=True) # Lines recorded while the file was held
+
+    def _compact(self, snapshot):
+        """Replaces the journal with one line per keyword. Called with the file lock held."""
+        directory = os.path.dirname(os.path.abspath(self.filepath))
+        fd, tmp_path = tempfile.mkstemp(prefix='.keyword-history-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for entry in snapshot:
+                    f.write(json.dumps(list(entry), ensure_ascii=False) + "\n")
+            os.replace(tmp_path, self.filepath)
+        except (IOError, OSError) as e:
+            print(f"[WARN] Could not compact {self.filepath}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def record(self, keyword):
+        """Counts one more use of ``keyword`` and appends it to the journal."""
+        keyword = keyword.strip()
+        if not keyword:
+            return
+        last_used = int(time.time())
+        with self._lock:
+            self._unwritten.append(json.dumps([keyword, 1, last_used], ensure_ascii=False) + "\n")
+            if self.loaded:
+                self._apply(self.entries, self.trie, keyword, 1, last_used)
+            elif self._journal_read:
+                self._pending.append((keyword, last_used))
+            # Otherwise load() has not read the journal yet and will pick this line up
+        self._flush_journal()
+
+    def complete(self, prefix, limit=AUTOCOMPLETE_LIMIT):
+        """Returns the best past keywords for ``prefix``; empty until the history has loaded."""
+        if not self.loaded or not prefix:
+            return []
+        return self.trie.complete(prefix, limit)
+
+
+def check_corrupt_journal():
+    """Regression check: corrupt journal lines are skipped and the rest of the history still loads."""
+    corrupt = ['5', '["seo","x",3]', '["ab",1,null]', '["ab",true,3]', '["ab",1]', '{"a":1}', '[""' , '[1,2,3]']
+    fd, path = tempfile.mkstemp(suffix='.jsonl')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write('["seo tips",2,100]\n' + '\n'.join(corrupt) + '\n["seo tools",1,200]\n')
+        history = KeywordHistory(path)
+        history.load()
+        assert history.loaded, "history did not finish loading"
+        assert history.complete("seo") == ["seo tips", "seo tools"], history.complete("seo")
+    finally:
+        os.remove(path)
+    print(f"Corrupt journal check passed ({len(corrupt)} bad lines skipped)")
+
+
+if __name__ == "__main__":
+    import random
+    import string
+
+    check_corrupt_journal()
+
+    # Lookup timing against a synthetic history (default 100k keywords)
+    import sys
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rng = random.Random(1)
+    words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8))) for _ in range(3000)]
+    keywords = list(dict.fromkeys(' '.join(rng.choices(words, k=rng.randint(2, 4))) for _ in range(count * 2)))[:count]
+
+    history = KeywordHistory(os.devnull)
+    history.loaded = True
+    started = time.perf_counter()
+    for i, keyword in enumerate(keywords):
+        history._apply(history.entries, history.trie, keyword, rng.randint(1, 50), i)
+    print(f"Built trie for {len(keywords)} keywords in {time.perf_counter() - started:.2f}s")
+
+    prefixes = [keyword[:rng.randint(1, 12)] for keyword in rng.sample(keywords, 10000)]
+    started = time.perf_counter()
+    for prefix in prefixes:
+        history.complete(prefix)
+    per_lookup_ms = (time.perf_counter() - started) / len(prefixes) * 1000
+    print(f"Average lookup: {per_lookup_ms:.4f}ms")
+    raise SystemExit(0 if per_lookup_ms < 1 else 1)
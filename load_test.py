@@ -0,0 +1,128 @@
+# load_test.py
+"""Load test for the HTTP service: reports requests per second and latency percentiles.
+
+Usage:
+    python load_test.py --spawn                      # start a local server and test it
+    python load_test.py --port 8765 --requests 5000 --concurrency 100
+    python load_test.py --spawn --endpoint batch --batch-size 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from server import DEFAULT_HOST, DEFAULT_PORT
+
+
+def _build_request(endpoint, host, i, batch_size):
+    if endpoint == 'generate':
+        method, path, payload = 'POST', '/generate', {"keyword": f"keyword {i % 100}"}
+    elif endpoint == 'batch':
+        method, path, payload = 'POST', '/generate/batch', {"keywords": [f"keyword {i}-{j}" for j in range(batch_size)]}
+    elif endpoint == 'favorites':
+        method, path, payload = 'GET', '/favorites', None
+    else:
+        method, path, payload = 'GET', '/health', None
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    head = (f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+    return head.encode('latin-1') + body
+
+
+async def _read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Server closed the connection.")
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def _client(host, port, counter, total, endpoint, batch_size, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while counter[0] < total:
+            i = counter[0]
+            counter[0] += 1
+            started = time.perf_counter()
+            writer.write(_build_request(endpoint, host, i, batch_size))
+            await writer.drain()
+            status = await _read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run(host, port, total, concurrency, endpoint, batch_size):
+    latencies, errors, counter = [], [], [0]
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, counter, total, endpoint, batch_size, latencies, errors)
+        for _ in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"Endpoint: {endpoint}  requests: {len(latencies)}  concurrency: {concurrency}  errors: {len(errors)}")
+    print(f"Throughput: {len(latencies) / elapsed:,.0f} req/s over {elapsed:.2f}s")
+    print("Latency (ms): " + "  ".join(
+        f"p{pct}={_percentile(latencies, pct) * 1000:.2f}" for pct in (50, 90, 99)
+    ) + f"  max={latencies[-1] * 1000:.2f}")
+    return not errors
+
+
+def _spawn_server(port, extra_args):
+    command = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'server.py'),
+               '--port', str(port)] + extra_args
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            asyncio.run(asyncio.open_connection(DEFAULT_HOST, port))
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Server did not start within 10 seconds.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--endpoint", choices=("generate", "batch", "favorites", "health"), default="generate")
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--spawn", action="store_true", help="Start a local server for the duration of the test")
+    parser.add_argument("--server-args", default="", help="Extra arguments for the spawned server")
+    args = parser.parse_args()
+
+    server_process = _spawn_server(args.port, args.server_args.split()) if args.spawn else None
+    try:
+        ok = asyncio.run(run(args.host, args.port, args.requests, args.concurrency, args.endpoint, args.batch_size))
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+            server_process.wait()
+    sys.exit(0 if ok else 1)
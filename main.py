@@ -1,48 +1,35 @@
 # main_app.py
 import customtkinter as ctk
+import argparse
+import itertools
 import json
-import datetime
 import os
-import random
+import threading
+import time
 import pyperclip  # For clipboard functionality
 import tkinter  # Explicitly import tkinter for messagebox parent
 from tkinter import messagebox # Use standard tkinter messagebox
+from favorites_store import FAVORITES_FILE, FavoritesStore
+from generator import DEFAULT_TEMPLATES, TEMPLATES_FILE, IdeaGenerator, flatten_templates
+from keyword_history import AUTOCOMPLETE_LIMIT, KEYWORD_HISTORY_FILE, KeywordHistory
 
 # --- Constants ---
-TEMPLATES_FILE = 'templates.json'
-FAVORITES_FILE = 'favorites.json'
-DEFAULT_NUMBER = 5 # Default number for listicles etc.
-
-# --- Default Templates Structure (Used as fallback and for initial creation) ---
-DEFAULT_TEMPLATES = {
-  "howto": [
-    "How to Get Started with {keyword} Step-by-Step",
-    "A Beginner's Guide to Understanding {topic}",
-    "How to Effectively Use {keyword} for Small Businesses"
-  ],
-  "listicle": [
-    "Top {number} Tips for Mastering {keyword} in {year}",
-    "{number} Common Mistakes to Avoid with {topic}",
-    "The {number} Essential Tools for Anyone Using {keyword}"
-  ],
-  "questions": [
-    "What Exactly Is {topic} and Why Does It Matter?",
-    "Is {keyword} Still a Valuable Skill in {year}?",
-    "How Can {topic} Improve [Specific Outcome e.g., Customer Engagement]?"
-  ],
-  "guides": [
-    "The Ultimate {year} Guide to {topic}",
-    "Everything You Need to Know About {keyword}"
-  ]
-}
+FAVORITES_POLL_MS = 1000 # How often to check for favorites changed by other instances
+LIVE_DEBOUNCE_MS = 150 # Quiet time after the last keystroke before live generation runs
+LIVE_PREVIEW_COUNT = 5 # Ideas shown immediately in live mode (kept within one ~16ms frame)
+LIVE_BATCH_SIZE = 25 # Ideas added per event-loop turn while filling in the rest
+HISTORY_LOAD_DELAY_MS = 500 # Keyword history loads in the background once the window is up
 
 
 # --- Main Application Class ---
 class IdeaGeneratorApp(ctk.CTk):
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, profiler=None, **kwargs):
         super().__init__(*args, **kwargs)
         print("[DEBUG] Initializing IdeaGeneratorApp...") # DEBUG PRINT
+        self.profiler = profiler # profiling.EventProfiler when started with --profile
+        if self.profiler is not None:
+            self.profiler.instrument(self) # Before any widget binds a handler
 
         # --- Window Setup ---
         self.title("Content Idea Generator Pro")
@@ -54,18 +41,30 @@ class IdeaGeneratorApp(ctk.CTk):
         print("[DEBUG] Loading templates...") # DEBUG PRINT
         self.templates = self._load_json_data(TEMPLATES_FILE, default_data=DEFAULT_TEMPLATES)
         print("[DEBUG] Loading favorites...") # DEBUG PRINT
-        self.favorites = self._load_json_data(FAVORITES_FILE, default_data=[])
+        self.favorites_store = FavoritesStore(FAVORITES_FILE)
+        self.favorites = self.favorites_store.items # Shared list, updated in place by the store
+        try:
+            self.favorites_store.load()
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Error loading {FAVORITES_FILE}: {e}") # DEBUG PRINT
+            messagebox.showerror("File Load Error", f"Error loading {os.path.basename(FAVORITES_FILE)}:\n{e}")
         print("[DEBUG] Flattening templates...") # DEBUG PRINT
-        self.all_template_strings = self._flatten_templates(self.templates)
+        self.all_templates = self._flatten_templates(self.templates)
+        self.generator = IdeaGenerator(self.all_templates)
+        self._live_after_id = None # Pending debounce callback
+        self._live_text = "" # Entry text live mode last scheduled for; keys that leave it unchanged are ignored
+        self._live_token = 0 # Bumped on every keystroke so stale live fills stop
+        self.keyword_history = KeywordHistory(KEYWORD_HISTORY_FILE) # Loaded later, see _start_history_load
+        self._suggestions = []
 
         # --- DEBUG: Print loaded template info ---
         print("--- Templates Loaded ---")
-        print(f"Loaded {len(self.all_template_strings)} template strings.")
-        # print(self.all_template_strings) # Optional: Uncomment to see all loaded templates
+        print(f"Loaded {len(self.all_templates)} templates.")
+        # print(self.all_templates) # Optional: Uncomment to see all loaded templates
         print("------------------------")
         # --- END DEBUG ---
 
-        if not self.all_template_strings:
+        if not self.all_templates:
              print("Warning: No templates were loaded. Check templates.json and defaults.")
              messagebox.showwarning("Template Warning", "Could not load templates. Generator may not work.")
 
@@ -84,6 +83,21 @@ class IdeaGeneratorApp(ctk.CTk):
         self.keyword_entry = ctk.CTkEntry(self.input_frame, placeholder_text="Enter primary keyword or topic...")
         self.keyword_entry.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="ew")
         self.keyword_entry.bind("<Return>", self._generate_ideas_event)
+        self.keyword_entry.bind("<KeyRelease>", self._on_keyword_key)
+        self.live_switch = ctk.CTkSwitch(self.input_frame, text="⚡ Live", width=60)
+        self.live_switch.grid(row=0, column=2, padx=(0, 10), pady=10)
+        self.keyword_entry.bind("<FocusOut>", lambda e: self.after(150, self._hide_suggestions))
+
+        # --- Autocomplete Dropdown (placed under the entry when there are suggestions) ---
+        self.suggestion_frame = ctk.CTkFrame(self, border_width=1)
+        self.suggestion_buttons = [
+            ctk.CTkButton(
+                self.suggestion_frame, text="", anchor="w", height=24, fg_color="transparent",
+                text_color=("gray10", "gray90"), hover_color=("gray75", "gray30"),
+                command=lambda i=i: self._accept_suggestion(i)
+            )
+            for i in range(AUTOCOMPLETE_LIMIT)
+        ]
 
         # --- Button Frame ---
         self.button_frame = ctk.CTkFrame(self)
@@ -115,6 +129,10 @@ class IdeaGeneratorApp(ctk.CTk):
         # --- Initial Population ---
         print("[DEBUG] Displaying initial favorites...") # DEBUG PRINT
         self._display_favorites()
+        self.after(FAVORITES_POLL_MS, self._poll_favorites)
+        self.after(HISTORY_LOAD_DELAY_MS, self._start_history_load)
+        if self.profiler is not None:
+            self.profiler.start_lag_monitor(self)
         print("[DEBUG] Initialization complete.") # DEBUG PRINT
 
     # --- Helper Methods ---
@@ -136,35 +154,10 @@ class IdeaGeneratorApp(ctk.CTk):
             messagebox.showerror("File Load Error", f"Error loading {os.path.basename(filepath)}:\n{e}\nUsing default data.", parent=parent)
             return json.loads(json.dumps(effective_default)) # Return copy
 
-    def _save_json_data(self, filepath, data):
-        """Safely saves data to a JSON file."""
-        print(f"[DEBUG] Saving data to: {filepath}") # DEBUG PRINT
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"[DEBUG] Successfully saved data to {filepath}.") # DEBUG PRINT
-            return True
-        except IOError as e:
-            print(f"[ERROR] Error saving {filepath}: {e}") # DEBUG PRINT
-            messagebox.showerror("File Save Error", f"Error saving {os.path.basename(filepath)}:\n{e}", parent=self)
-            return False
-
     def _flatten_templates(self, template_data):
         """Converts categorized templates into a single list."""
         print("[DEBUG] Flattening templates...") # DEBUG PRINT
-        flat_list = []
-        if isinstance(template_data, dict):
-            for category, category_list in template_data.items():
-                if isinstance(category_list, list):
-                    print(f"[DEBUG] Adding {len(category_list)} templates from category '{category}'") # DEBUG PRINT
-                    flat_list.extend(category_list)
-                else:
-                    print(f"[WARN] Expected list for template category '{category}', got {type(category_list)}") # DEBUG PRINT
-        elif isinstance(template_data, list):
-             print("[DEBUG] Template data is already a list.") # DEBUG PRINT
-             flat_list = template_data
-        else:
-             print(f"[WARN] Template data is not a dict or list, type is {type(template_data)}") # DEBUG PRINT
+        flat_list = flatten_templates(template_data)
         print(f"[DEBUG] Total flattened templates: {len(flat_list)}") # DEBUG PRINT
         return flat_list
 
@@ -181,42 +174,13 @@ class IdeaGeneratorApp(ctk.CTk):
     def _perform_generation(self, keyword):
         """Generates ideas using loaded templates."""
         print(f"[DEBUG] Performing generation for keyword: '{keyword}'") # DEBUG PRINT
-        if not self.all_template_strings:
+        if not self.all_templates:
             print("[ERROR] No templates available for generation.") # DEBUG PRINT
             messagebox.showerror("Template Error", "No templates available. Please check templates.json or defaults.", parent=self)
             return []
 
-        generated = []
-        current_year = datetime.datetime.now().year
-        idea_set = set()
-
-        print(f"[DEBUG] Processing {len(self.all_template_strings)} templates...") # DEBUG PRINT
-        for i, template in enumerate(self.all_template_strings):
-            # print(f"[DEBUG]  Template {i+1}: {template}") # Optional: Very verbose
-            try:
-                format_dict = {
-                    "keyword": keyword, "topic": keyword, "year": current_year,
-                    "number": DEFAULT_NUMBER, "competitor_placeholder": "[Competitor]",
-                    "benefit_placeholder": "[Benefit]"
-                }
-                idea = template
-                placeholders_found = 0
-                for key, value in format_dict.items():
-                    placeholder = "{" + key + "}"
-                    if placeholder in idea:
-                         idea = idea.replace(placeholder, str(value))
-                         placeholders_found += 1
-                # Only add if at least one placeholder was replaced (or be less strict?)
-                # if placeholders_found > 0:
-                idea_set.add(idea)
-                # else:
-                #     print(f"[DEBUG]  Skipping template (no placeholders found/replaced): {template}")
-
-            except Exception as e:
-                print(f"[ERROR] Error processing template '{template}': {e}") # DEBUG PRINT
-
-        generated = list(idea_set)
-        random.shuffle(generated)
+        print(f"[DEBUG] Processing {len(self.all_templates)} templates...") # DEBUG PRINT
+        generated = self.generator.generate(keyword)
         print(f"[DEBUG] Generated {len(generated)} unique ideas.") # DEBUG PRINT
         return generated
 
@@ -229,6 +193,9 @@ class IdeaGeneratorApp(ctk.CTk):
             messagebox.showwarning("Input Required", "Please enter a keyword or topic first.", parent=self)
             return
 
+        self._cancel_live_generation()
+        self._hide_suggestions()
+        self.keyword_history.record(keyword)
         self._update_status("Generating ideas...")
         ideas = self._perform_generation(keyword)
         print(f"Ideas generated internally (list): {ideas}") # DEBUG PRINT
@@ -241,9 +208,9 @@ class IdeaGeneratorApp(ctk.CTk):
 
         if ideas:
             print(f"[DEBUG] Attempting to add {len(ideas)} idea widgets...") # DEBUG PRINT
-            for i, idea_text in enumerate(ideas):
+            for i, record in enumerate(ideas):
                 # print(f"[DEBUG] Adding widget {i+1}...") # Optional: Verbose
-                self._add_idea_widget(self.output_scrollable_frame, idea_text)
+                self._add_idea_widget(self.output_scrollable_frame, record)
             self._update_status(f"Generated {len(ideas)} ideas.")
             print(f"[DEBUG] Finished adding {len(ideas)} widgets.") # DEBUG PRINT
         else:
@@ -252,16 +219,113 @@ class IdeaGeneratorApp(ctk.CTk):
             no_ideas_label = ctk.CTkLabel(self.output_scrollable_frame, text="No ideas generated. Check templates or input.")
             no_ideas_label.pack(pady=10)
 
-    def _add_idea_widget(self, parent_frame, idea_text):
+    def _on_keyword_key(self, event=None):
+        """Updates autocomplete and debounces live mode; every key makes in-flight live results stale."""
+        if event is not None and event.keysym in ("Return", "Escape"):
+            self._hide_suggestions()
+            return
+        self._update_suggestions()
+        if not self.live_switch.get():
+            return
+        text = self.keyword_entry.get()
+        if text == self._live_text: # Shift, arrows, Ctrl etc. must not wipe and regenerate the output
+            return
+        self._live_text = text
+        self._cancel_live_generation()
+        self._live_after_id = self.after(LIVE_DEBOUNCE_MS, self._run_live_generation)
+
+    def _start_history_load(self):
+        """Loads the keyword history on a worker thread so it never delays startup."""
+        print("[DEBUG] Loading keyword history in the background...") # DEBUG PRINT
+        threading.Thread(target=self.keyword_history.load, name="keyword-history", daemon=True).start()
+
+    def _update_suggestions(self):
+        """Shows past keywords matching the current entry text in the dropdown."""
+        prefix = self.keyword_entry.get().strip()
+        self._suggestions = [k for k in self.keyword_history.complete(prefix) if k != prefix]
+        if not self._suggestions:
+            self._hide_suggestions()
+            return
+        for i, button in enumerate(self.suggestion_buttons):
+            if i < len(self._suggestions):
+                button.configure(text=self._suggestions[i])
+                button.pack(fill="x", padx=2, pady=1)
+            else:
+                button.pack_forget()
+        self.suggestion_frame.place(in_=self.keyword_entry, relx=0, rely=1, relwidth=1, y=2)
+        self.suggestion_frame.lift()
+
+    def _hide_suggestions(self):
+        self.suggestion_frame.place_forget()
+
+    def _accept_suggestion(self, index):
+        """Fills the entry with a suggested keyword and generates ideas for it."""
+        if index >= len(self._suggestions):
+            return
+        self.keyword_entry.delete(0, tkinter.END)
+        self.keyword_entry.insert(0, self._suggestions[index])
+        self._hide_suggestions()
+        self._generate_ideas_event()
+
+    def _cancel_live_generation(self):
+        """Drops any pending debounce and stops live fills for an outdated keyword."""
+        self._live_token += 1
+        if self._live_after_id is not None:
+            self.after_cancel(self._live_after_id)
+            self._live_after_id = None
+
+    def _run_live_generation(self):
+        """Shows a small preview for the current keyword, then fills in the rest in batches."""
+        self._live_after_id = None
+        started = time.perf_counter() # The frame budget includes taking down the previous results
+        keyword = self.keyword_entry.get().strip()
+        old_rows = self.output_scrollable_frame.winfo_children()
+        for widget in old_rows:
+            widget.pack_forget() # Hiding is cheap; destroying a long list waits until after the preview
+        if old_rows:
+            self.after(1, self._destroy_widgets, old_rows)
+        if not keyword or not self.generator.compiled:
+            self._update_status("Ready.")
+            return
+
+        ideas = self.generator.iter_ideas(keyword)
+        preview = list(itertools.islice(ideas, LIVE_PREVIEW_COUNT))
+        for record in preview:
+            self._add_idea_widget(self.output_scrollable_frame, record)
+        print(f"[DEBUG] Live preview for '{keyword}' rendered in {(time.perf_counter() - started) * 1000:.1f}ms") # DEBUG PRINT
+        self._update_status(f"Generating ideas for '{keyword}'...")
+        self.after(1, self._fill_live_results, self._live_token, keyword, ideas, len(preview))
+
+    def _destroy_widgets(self, widgets):
+        """Destroys widgets that were hidden earlier, unless something else already did."""
+        for widget in widgets:
+            if widget.winfo_exists():
+                widget.destroy()
+
+    def _fill_live_results(self, token, keyword, ideas, shown):
+        """Adds the next batch of live results unless the keyword has changed since."""
+        if token != self._live_token:
+            ideas.close() # Stale prefix: abandon the half-rendered pass
+            return
+        batch = list(itertools.islice(ideas, LIVE_BATCH_SIZE))
+        for record in batch:
+            self._add_idea_widget(self.output_scrollable_frame, record)
+        shown += len(batch)
+        if len(batch) == LIVE_BATCH_SIZE:
+            self.after(1, self._fill_live_results, token, keyword, ideas, shown)
+        else:
+            self._update_status(f"Generated {shown} ideas for '{keyword}'.")
+
+    def _add_idea_widget(self, parent_frame, record):
         # DEBUG PRINT inside the function
-        print(f"  [DEBUG] Adding widget for idea: '{idea_text[:50]}...'")
-        """Creates a frame for a single generated idea with buttons."""
+        print(f"  [DEBUG] Adding widget for idea: '{record.text[:50]}...'")
+        """Creates a frame for a single generated IdeaRecord with buttons."""
         try: # Add try-except around widget creation for safety
             idea_frame = ctk.CTkFrame(parent_frame, fg_color="transparent")
             idea_frame.pack(fill="x", pady=2, padx=5)
             idea_frame.grid_columnconfigure(0, weight=1)
 
-            idea_label = ctk.CTkLabel(idea_frame, text=idea_text, wraplength=550, justify="left", anchor="w")
+            idea_label = ctk.CTkLabel(idea_frame, text=record.text, wraplength=550, justify="left", anchor="w")
             idea_label.grid(row=0, column=0, padx=(5, 10), pady=2, sticky="ew")
 
             button_frame = ctk.CTkFrame(idea_frame, fg_color="transparent")
@@ -269,68 +333,79 @@ class IdeaGeneratorApp(ctk.CTk):
 
             fav_button = ctk.CTkButton(
                 button_frame, text="⭐", width=30,
-                command=lambda t=idea_text: self._add_to_favorites(t)
+                command=lambda r=record: self._add_to_favorites(r)
             )
             fav_button.pack(side=tkinter.LEFT, padx=(0, 5))
 
             copy_button = ctk.CTkButton(
                 button_frame, text="📋", width=30,
-                command=lambda t=idea_text: self._copy_to_clipboard(t)
+                command=lambda r=record: self._copy_to_clipboard(r.text)
             )
             copy_button.pack(side=tkinter.LEFT)
         except Exception as e:
-            print(f"[ERROR] Failed to create widget for idea '{idea_text[:50]}...': {e}") # DEBUG PRINT
+            print(f"[ERROR] Failed to create widget for idea '{record.text[:50]}...': {e}") # DEBUG PRINT
 
-    def _add_favorite_widget(self, parent_frame, idea_text):
+    def _add_favorite_widget(self, parent_frame, record):
         """Creates a frame for a single favorite idea."""
-        print(f"  [DEBUG] Adding favorite widget for: '{idea_text[:50]}...'") # DEBUG PRINT
+        print(f"  [DEBUG] Adding favorite widget for: '{record.text[:50]}...'") # DEBUG PRINT
         try:
             fav_frame = ctk.CTkFrame(parent_frame, fg_color="transparent")
             fav_frame.pack(fill="x", pady=2, padx=5)
             fav_frame.grid_columnconfigure(0, weight=1)
 
-            fav_label = ctk.CTkLabel(fav_frame, text=idea_text, wraplength=550, justify="left", anchor="w")
+            fav_label = ctk.CTkLabel(fav_frame, text=record.text, wraplength=550, justify="left", anchor="w")
             fav_label.grid(row=0, column=0, padx=(5, 10), pady=2, sticky="ew")
 
             remove_button = ctk.CTkButton(
                 fav_frame, text="❌", width=30, fg_color="grey",
-                command=lambda t=idea_text: self._remove_from_favorites(t)
+                command=lambda r=record: self._remove_from_favorites(r)
             )
             remove_button.grid(row=0, column=1, padx=(0, 5), pady=2, sticky="e")
         except Exception as e:
-             print(f"[ERROR] Failed to create favorite widget for idea '{idea_text[:50]}...': {e}") # DEBUG PRINT
+             print(f"[ERROR] Failed to create favorite widget for idea '{record.text[:50]}...': {e}") # DEBUG PRINT
 
 
-    def _add_to_favorites(self, idea_text):
-        """Adds an idea to the favorites list and saves."""
-        print(f"[DEBUG] Attempting to add to favorites: '{idea_text[:50]}...'") # DEBUG PRINT
-        if idea_text not in self.favorites:
-            self.favorites.append(idea_text)
-            if self._save_json_data(FAVORITES_FILE, self.favorites):
-                self._update_status(f"'{idea_text[:30]}...' added to favorites.")
-                self._display_favorites()
-            else:
-                self._update_status("Error saving favorites.")
-                self.favorites.remove(idea_text)
+    def _add_to_favorites(self, record):
+        """Adds an IdeaRecord to the favorites list and saves."""
+        print(f"[DEBUG] Attempting to add to favorites: '{record.text[:50]}...'") # DEBUG PRINT
+        try:
+            added = self.favorites_store.add(record)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Error saving {FAVORITES_FILE}: {e}") # DEBUG PRINT
+            messagebox.showerror("File Save Error", f"Error saving {os.path.basename(FAVORITES_FILE)}:\n{e}", parent=self)
+            self._update_status("Error saving favorites.")
+            return
+        if added:
+            self._update_status(f"'{record.text[:30]}...' added to favorites.")
         else:
             self._update_status("Already in favorites.")
+        self._display_favorites() # The store may also have picked up other instances' changes
 
-    def _remove_from_favorites(self, idea_text):
+    def _remove_from_favorites(self, record):
         """Removes an idea from favorites and saves."""
-        print(f"[DEBUG] Attempting to remove from favorites: '{idea_text[:50]}...'") # DEBUG PRINT
-        if idea_text in self.favorites:
-            try:
-                self.favorites.remove(idea_text)
-                if self._save_json_data(FAVORITES_FILE, self.favorites):
-                    self._update_status(f"Removed '{idea_text[:30]}...' from favorites.")
-                    self._display_favorites()
-                else:
-                    self._update_status("Error saving favorites after removal.")
-                    self.favorites.append(idea_text)
-            except ValueError:
-                 self._update_status("Item not found in favorites list (internal state error).")
+        print(f"[DEBUG] Attempting to remove from favorites: '{record.text[:50]}...'") # DEBUG PRINT
+        try:
+            removed = self.favorites_store.remove(record)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Error saving {FAVORITES_FILE}: {e}") # DEBUG PRINT
+            messagebox.showerror("File Save Error", f"Error saving {os.path.basename(FAVORITES_FILE)}:\n{e}", parent=self)
+            self._update_status("Error saving favorites after removal.")
+            return
+        if removed:
+            self._update_status(f"Removed '{record.text[:30]}...' from favorites.")
         else:
-             self._update_status("Item not found in favorites.")
+            self._update_status("Item not found in favorites.")
+        self._display_favorites()
+
+    def _poll_favorites(self):
+        """Picks up favorites added or removed by other running instances."""
+        try:
+            if self.favorites_store.refresh_if_changed():
+                print("[DEBUG] Favorites changed on disk, refreshing display.") # DEBUG PRINT
+                self._display_favorites()
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Could not refresh favorites: {e}") # DEBUG PRINT
+        self.after(FAVORITES_POLL_MS, self._poll_favorites)
 
     def _copy_to_clipboard(self, text):
         """Copies the given text to the system clipboard."""
@@ -357,6 +432,9 @@ class IdeaGeneratorApp(ctk.CTk):
     def _clear_fields(self):
         """Clears input, output, and status."""
         print("[DEBUG] Clearing fields...") # DEBUG PRINT
+        self._cancel_live_generation()
+        self._live_text = ""
+        self._hide_suggestions()
         self.keyword_entry.delete(0, tkinter.END)
         for widget in self.output_scrollable_frame.winfo_children():
             widget.destroy()
@@ -373,9 +451,9 @@ class IdeaGeneratorApp(ctk.CTk):
         if self.favorites:
             print(f"[DEBUG] Found {len(self.favorites)} favorites to display.") # DEBUG PRINT
             # Display in reverse order so newest appear at top
-            for i, fav_text in enumerate(reversed(self.favorites)):
+            for i, record in enumerate(reversed(self.favorites)):
                 # print(f"[DEBUG] Adding favorite widget {i+1}...") # Optional: Verbose
-                self._add_favorite_widget(self.favorites_scrollable_frame, fav_text)
+                self._add_favorite_widget(self.favorites_scrollable_frame, record)
         else:
             print("[DEBUG] No favorites found to display.") # DEBUG PRINT
             no_favs_label = ctk.CTkLabel(self.favorites_scrollable_frame, text="No favorites saved yet.")
@@ -405,8 +483,31 @@ if __name__ == "__main__":
         except IOError as e:
             print(f"ERROR: Could not create default favorites file: {e}")
 
+    parser = argparse.ArgumentParser(description="Content Idea Generator Pro")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run the local HTTP service instead of the GUI (see server.py --help for its options)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile UI events (cProfile + tracemalloc) and event-loop lag, writing a report on exit")
+    parser.add_argument("--profile-dir", default=None,
+                        help="Directory for .pstats files and the profiling report (default: profiles)")
+    args, remaining = parser.parse_known_args()
+    if args.serve:
+        import server
+        server.main(remaining)
+        raise SystemExit(0)
+
+    profiler = None
+    if args.profile:
+        import profiling
+        profiler = profiling.EventProfiler(args.profile_dir or profiling.PROFILE_DIR)
+        print(f"[DEBUG] Profiling enabled, writing to {profiler.output_dir}") # DEBUG PRINT
+
     print("[DEBUG] Creating App instance...") # DEBUG PRINT
-    app = IdeaGeneratorApp()
+    app = IdeaGeneratorApp(profiler=profiler)
     print("[DEBUG] Starting main loop...") # DEBUG PRINT
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        if profiler is not None:
+            print(f"Profiling report written to {profiler.write_report()}")
     print("[DEBUG] Main loop finished.") # DEBUG PRINT
\ No newline at end of file
@@ -0,0 +1,131 @@
+# placeholders.py
+"""Registry of placeholder providers whose values come from local data files."""
+import json
+import os
+import random
+import re
+import threading
+
+# --- Constants ---
+PLACEHOLDER_DATA_DIR = 'placeholder_data'
+
+# Built-in providers: name -> (data file stem, aliases, fallback text when the file has no values)
+BUILTIN_PROVIDERS = {
+    "competitor": ("competitors", ("competitor_placeholder",), "[Competitor]"),
+    "benefit": ("benefits", ("benefit_placeholder",), "[Benefit]"),
+    "audience": ("audiences", ("target_audience",), None),
+    "outcome": ("outcomes", ("specific_outcome",), None),
+}
+
+_NAME_CLEANUP = re.compile(r"[^a-z0-9]+")
+
+
+def placeholder_name(label):
+    """Turns a bracket label like 'Specific Outcome e.g., Customer Engagement' into 'specific_outcome'."""
+    label = re.split(r"\be\.g\.|,|:", label, maxsplit=1)[0]
+    return _NAME_CLEANUP.sub("_", label.lower()).strip("_")
+
+
+class FileProvider:
+    """Supplies values from a ``.txt`` (one per line, ``#`` comments) or ``.json`` (list) file.
+
+    The file is read the first time a value is needed and memoized after that.
+    """
+
+    def __init__(self, filepath, fallback=None):
+        self.filepath = filepath
+        self.fallback = fallback
+        self._values = None
+
+    def values(self):
+        if self._values is None:
+            self._values = self._load()
+        return self._values
+
+    def _load(self):
+        if not os.path.exists(self.filepath):
+            return []
+        try:
+            with open(self.filepath, 'r', encoding='utf-8') as f:
+                if self.filepath.endswith('.json'):
+                    data = json.load(f)
+                    values = data if isinstance(data, list) else []
+                else:
+                    values = [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"[ERROR] Error loading placeholder data {self.filepath}: {e}")
+            return []
+        return [str(value) for value in values if str(value).strip()]
+
+    def pick(self, rng=random):
+        """Returns a random value, or the fallback (possibly None) when there is no data."""
+        values = self.values()
+        return rng.choice(values) if values else self.fallback
+
+
+class PlaceholderRegistry:
+    """Maps placeholder names and aliases to providers.
+
+    Registering is cheap: no data is read until a provider is asked for a value,
+    so the registry can hold any number of providers without slowing generation.
+    """
+
+    def __init__(self):
+        self._providers = {}
+        self._aliases = {}
+
+    def register(self, name, provider, aliases=()):
+        self._providers[name] = provider
+        for alias in aliases:
+            self._aliases[alias] = name
+
+    def get(self, name):
+        return self._providers.get(self._aliases.get(name, name))
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __len__(self):
+        return len(self._providers)
+
+
+def default_registry(data_dir=PLACEHOLDER_DATA_DIR):
+    """Builds a registry with the built-in providers plus one per extra data file in ``data_dir``.
+
+    Extra files are registered under their file name, so ``personas.txt`` serves
+    ``{personas}`` and ``[Personas]`` without any code changes.
+    """
+    registry = PlaceholderRegistry()
+    claimed = set()
+    for name, (stem, aliases, fallback) in BUILTIN_PROVIDERS.items():
+        filepath = os.path.join(data_dir, stem + '.txt')
+        if not os.path.exists(filepath) and os.path.exists(os.path.join(data_dir, stem + '.json')):
+            filepath = os.path.join(data_dir, stem + '.json')
+        registry.register(name, FileProvider(filepath, fallback), aliases=aliases + (stem,))
+        claimed.add(stem)
+
+    if os.path.isdir(data_dir):
+        for filename in sorted(os.listdir(data_dir)):
+            stem, ext = os.path.splitext(filename)
+            if ext in ('.txt', '.json') and stem not in claimed:
+                registry.register(placeholder_name(stem), FileProvider(os.path.join(data_dir, filename)))
+                claimed.add(stem)
+    return registry
+
+
+_shared_registries = {} # data_dir -> registry, so every generator in a process shares one set of providers
+_shared_lock = threading.Lock()
+
+
+def shared_registry(data_dir=PLACEHOLDER_DATA_DIR):
+    """Returns the process-wide ``default_registry`` for ``data_dir``, building it on first use.
+
+    Providers memoize their files, so sharing the registry means each data
+    file is read at most once per process however many generators exist.
+    """
+    key = os.path.abspath(data_dir)
+    with _shared_lock:
+        registry = _shared_registries.get(key)
+        if registry is None:
+            registry = _shared_registries[key] = default_registry(data_dir)
+        return registry
@@ -0,0 +1,219 @@
+# profiling.py
+"""Per-event profiling for the desktop app (enabled with ``python main.py --profile``).
+
+Each instrumented event handler runs under cProfile, and its ``.pstats`` file is
+kept in a size-capped rolling directory. tracemalloc tracks memory per event,
+and an ``after()`` heartbeat measures how late the Tk event loop runs callbacks.
+``write_report`` writes a summary an editor can send along with the ``.pstats`` files.
+"""
+import cProfile
+import datetime
+import functools
+import io
+import os
+import platform
+import pstats
+import statistics
+import time
+import tracemalloc
+from collections import deque
+
+# --- Constants ---
+PROFILE_DIR = 'profiles'
+PROFILED_EVENTS = (
+    "_generate_ideas_event", "_add_to_favorites", "_remove_from_favorites",
+    "_clear_fields", "_display_favorites",
+)
+MAX_PROFILE_BYTES = 50 * 1024 * 1024 # Oldest .pstats files are deleted beyond this
+LAG_INTERVAL_MS = 100 # Heartbeat period for event-loop lag
+SLOW_LAG_MS = 100 # Lag at or above this counts as a visible stall
+SNAPSHOT_EVERY = 10 # Full tracemalloc snapshots on the 1st call of an event and every Nth after
+TRACEMALLOC_FRAMES = 5
+REPORT_FILE = 'profile_report.txt'
+
+
+# Allocations made by the profiling machinery itself are left out of snapshot diffs
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, cProfile.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+class _EventStats:
+    __slots__ = ('calls', 'total_s', 'max_s', 'recent_s', 'memory_delta', 'memory_peak', 'top_growth')
+
+    def __init__(self):
+        self.calls = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.recent_s = deque(maxlen=1000) # For percentiles without unbounded growth
+        self.memory_delta = 0 # Net bytes still allocated after the handler returned, summed
+        self.memory_peak = 0 # Largest peak above the starting point seen in one call
+        self.top_growth = [] # Latest snapshot diff lines
+
+
+class EventProfiler:
+    """Wraps app event handlers with cProfile and tracemalloc and tracks event-loop lag."""
+
+    def __init__(self, output_dir=PROFILE_DIR, max_bytes=MAX_PROFILE_BYTES, lag_interval_ms=LAG_INTERVAL_MS):
+        self.output_dir = output_dir
+        self.max_bytes = max_bytes
+        self.lag_interval_ms = lag_interval_ms
+        self.started_at = datetime.datetime.now()
+        self.events = {}
+        self.lag_ms = deque(maxlen=10000)
+        self.slow_lag_count = 0
+        self.max_lag_ms = 0.0
+        self._depth = 0 # Nested handlers run inside the outer handler's profile
+        self._sequence = 0
+        self._lag_expected = None
+        os.makedirs(output_dir, exist_ok=True)
+        # Retained files are tracked in memory so the cap costs nothing per event; the directory is scanned once
+        self._retained = deque((path, os.path.getsize(path)) for path in self._scan_profile_files())
+        self._retained_bytes = sum(size for _, size in self._retained)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+
+    # --- Instrumentation ---
+    def instrument(self, app, names=PROFILED_EVENTS):
+        """Replaces each named bound method on ``app`` with a profiled wrapper.
+
+        Call this before widgets are created so button commands pick up the wrappers.
+        A handler called from inside another (e.g. ``_display_favorites`` after
+        ``_add_to_favorites``) is counted as part of the outer event.
+        """
+        for name in names:
+            setattr(app, name, self.wrap(name, getattr(app, name)))
+
+    def wrap(self, name, handler):
+        stats = self.events.setdefault(name, _EventStats())
+
+        @functools.wraps(handler)
+        def profiled(*args, **kwargs):
+            if self._depth > 0:
+                return handler(*args, **kwargs)
+            self._depth += 1
+            stats.calls += 1
+            take_snapshot = stats.calls == 1 or stats.calls % SNAPSHOT_EVERY == 0
+            before = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS) if take_snapshot else None
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            profile = cProfile.Profile()
+            started = time.perf_counter()
+            try:
+                return profile.runcall(handler, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                current, peak = tracemalloc.get_traced_memory()
+                self._depth -= 1
+                stats.total_s += elapsed
+                stats.max_s = max(stats.max_s, elapsed)
+                stats.recent_s.append(elapsed)
+                stats.memory_delta += current - start_bytes
+                stats.memory_peak = max(stats.memory_peak, peak - start_bytes)
+                if before is not None:
+                    after = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+                    diff = after.compare_to(before, "lineno")
+                    stats.top_growth = [str(line) for line in diff[:5]]
+                self._save_profile(name, profile)
+
+        return profiled
+
+    # --- Rolling .pstats Files ---
+    def _save_profile(self, name, profile):
+        self._sequence += 1
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.output_dir, f"{stamp}-{self._sequence:05d}-{name.lstrip('_')}.pstats")
+        try:
+            profile.dump_stats(path)
+            size = os.path.getsize(path)
+        except OSError as e:
+            print(f"[WARN] Could not write profile {path}: {e}")
+            return
+        self._retained.append((path, size))
+        self._retained_bytes += size
+        self._enforce_size_cap()
+
+    def _scan_profile_files(self):
+        paths = [os.path.join(self.output_dir, f) for f in os.listdir(self.output_dir) if f.endswith(".pstats")]
+        return sorted(paths, key=lambda path: (os.path.getmtime(path), path))
+
+    def profile_files(self):
+        """Returns the retained .pstats files, oldest first."""
+        return [path for path, _ in self._retained]
+
+    def _enforce_size_cap(self):
+        while self._retained and self._retained_bytes > self.max_bytes:
+            oldest, size = self._retained.popleft()
+            self._retained_bytes -= size
+            try:
+                os.remove(oldest)
+            except FileNotFoundError:
+                pass # Already deleted by hand
+
+    # --- Event-Loop Lag ---
+    def start_lag_monitor(self, app):
+        """Schedules an ``after()`` heartbeat and records how late each one fires."""
+        self._lag_expected = time.perf_counter() + self.lag_interval_ms / 1000
+        app.after(self.lag_interval_ms, self._lag_tick, app)
+
+    def _lag_tick(self, app):
+        lag_ms = max(0.0, (time.perf_counter() - self._lag_expected) * 1000)
+        self.lag_ms.append(lag_ms)
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        if lag_ms >= SLOW_LAG_MS:
+            self.slow_lag_count += 1
+        self.start_lag_monitor(app)
+
+    # --- Report ---
+    def write_report(self):
+        """Writes the summary report next to the .pstats files and returns its path."""
+        out = io.StringIO()
+        duration = datetime.datetime.now() - self.started_at
+        out.write("Content Idea Generator - profiling report\n")
+        out.write(f"Session: {self.started_at:%Y-%m-%d %H:%M:%S}, {duration.total_seconds():.0f}s\n")
+        out.write(f"Python {platform.python_version()} on {platform.platform()}\n\n")
+
+        out.write("Event handlers (ms):\n")
+        out.write(f"  {'event':<26}{'calls':>7}{'mean':>10}{'p95':>10}{'max':>10}{'mem net KB':>12}{'peak KB':>10}\n")
+        for name, stats in self.events.items():
+            if not stats.calls:
+                continue
+            recent = sorted(stats.recent_s)
+            p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))]
+            out.write(f"  {name:<26}{stats.calls:>7}{stats.total_s / stats.calls * 1000:>10.1f}"
+                      f"{p95 * 1000:>10.1f}{stats.max_s * 1000:>10.1f}"
+                      f"{stats.memory_delta / 1024:>12.1f}{stats.memory_peak / 1024:>10.1f}\n")
+
+        out.write("\nEvent-loop lag (after() heartbeat every "
+                  f"{self.lag_interval_ms}ms):\n")
+        if self.lag_ms:
+            lags = sorted(self.lag_ms)
+            out.write(f"  samples {len(lags)}, mean {statistics.mean(lags):.1f}ms, "
+                      f"p95 {lags[min(len(lags) - 1, int(len(lags) * 0.95))]:.1f}ms, max {self.max_lag_ms:.1f}ms, "
+                      f"stalls >= {SLOW_LAG_MS}ms: {self.slow_lag_count}\n")
+        else:
+            out.write("  no samples\n")
+
+        out.write("\nLargest allocation changes in the latest snapshot of each event:\n")
+        for name, stats in self.events.items():
+            if stats.top_growth:
+                out.write(f"  {name}:\n")
+                for line in stats.top_growth:
+                    out.write(f"    {line}\n")
+
+        files = self.profile_files()
+        out.write(f"\nRetained profiles: {len(files)} file(s) in {os.path.abspath(self.output_dir)}\n")
+        if files:
+            out.write("Top functions by cumulative time across retained profiles:\n")
+            stats_out = io.StringIO()
+            combined = pstats.Stats(*files, stream=stats_out)
+            combined.files = [] # Skip the per-file header lines; the directory is listed above
+            combined.strip_dirs().sort_stats("cumulative").print_stats(15)
+            out.write(stats_out.getvalue())
+
+        path = os.path.join(self.output_dir, REPORT_FILE)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(out.getvalue())
+        return path
@@ -0,0 +1,101 @@
+# records.py
+"""Compact record type for generated ideas and their provenance."""
+import time
+
+
+class IdeaRecord:
+    """A generated idea plus the keyword, template and category it came from.
+
+    ``__slots__`` keeps each record smaller than the equivalent dict. Records
+    compare and hash by ``text`` so the same idea is never stored twice.
+    On disk a record is a short JSON array (see ``to_json``); plain strings
+    from older favorites files are read as records without provenance.
+    """
+    __slots__ = ('text', 'keyword', 'template_id', 'category', 'created_at')
+
+    def __init__(self, text, keyword=None, template_id=None, category=None, created_at=None):
+        self.text = text
+        self.keyword = keyword
+        self.template_id = template_id
+        self.category = category
+        self.created_at = int(time.time()) if created_at is None else created_at # Unix seconds
+
+    def __eq__(self, other):
+        if not isinstance(other, IdeaRecord):
+            return NotImplemented
+        return self.text == other.text
+
+    def __hash__(self):
+        return hash(self.text)
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return (f"IdeaRecord({self.text!r}, keyword={self.keyword!r}, template_id={self.template_id!r}, "
+                f"category={self.category!r}, created_at={self.created_at!r})")
+
+    def __reduce__(self): # Compact pickling for executor round-trips
+        return (IdeaRecord, (self.text, self.keyword, self.template_id, self.category, self.created_at))
+
+    # --- Encoding ---
+    def to_json(self):
+        """Returns the compact on-disk form ``[text, keyword, template_id, category, created_at]``."""
+        return [self.text, self.keyword, self.template_id, self.category, self.created_at]
+
+    def to_dict(self):
+        """Returns a self-describing dict, used by the HTTP API."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @classmethod
+    def from_json(cls, value):
+        """Decodes the compact form, a dict, or a legacy plain-string favorite.
+
+        Raises ValueError unless text is a string, keyword, template_id and
+        category are strings or None, and created_at is an int or None.
+        """
+        if isinstance(value, str):
+            return cls(value, created_at=0) # Legacy entry, creation time unknown
+        if isinstance(value, list) and value and len(value) <= len(cls.__slots__):
+            fields = dict(zip(cls.__slots__, value))
+        elif isinstance(value, dict):
+            fields = {field: value.get(field) for field in cls.__slots__}
+        else:
+            raise ValueError(f"Cannot decode idea record from {value!r}")
+        if not isinstance(fields.get('text'), str):
+            raise ValueError(f"Idea record text must be a string, got {value!r}")
+        for field in ('keyword', 'template_id', 'category'):
+            if not isinstance(fields.get(field), (str, type(None))):
+                raise ValueError(f"Idea record {field} must be a string or null, got {fields[field]!r}")
+        created_at = fields.get('created_at')
+        if created_at is not None and (not isinstance(created_at, int) or isinstance(created_at, bool)):
+            raise ValueError(f"Idea record created_at must be an integer timestamp, got {created_at!r}")
+        return cls(**fields)
+
+
+def measure_memory(count=10000):
+    """Returns the average bytes per idea for records versus plain dicts with the same fields."""
+    import tracemalloc
+
+    def bytes_per_item(factory):
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        items = [factory(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del items
+        return (after - before) / count
+
+    # Field values are shared so only the container overhead is compared
+    text, keyword, template_id, category = "How to Get Started with SEO", "SEO", "howto:0", "howto"
+    created_at = int(time.time())
+    record_size = bytes_per_item(lambda i: IdeaRecord(text, keyword, template_id, category, created_at))
+    dict_size = bytes_per_item(lambda i: {"text": text, "keyword": keyword, "template_id": template_id,
+                                          "category": category, "created_at": created_at})
+    return record_size, dict_size
+
+
+if __name__ == "__main__":
+    record_size, dict_size = measure_memory()
+    print(f"IdeaRecord: {record_size:.0f} bytes/idea, dict: {dict_size:.0f} bytes/idea")
+    raise SystemExit(0 if record_size < dict_size else 1)
@@ -0,0 +1,382 @@
+# server.py
+"""Local HTTP service exposing idea generation, favorites and export.
+
+Run with ``python server.py`` (or ``python main.py --serve``). Endpoints:
+
+    GET    /health
+    POST   /generate          {"keyword": "..."}
+    POST   /generate/batch    {"keywords": ["...", ...]}
+    GET    /favorites
+    POST   /favorites         {"idea": "..."} or {"idea": {record fields}}
+    DELETE /favorites         {"idea": "..."}
+    GET    /export?format=ndjson|text   (streamed, chunked)
+
+Ideas are returned as IdeaRecord dicts (text, keyword, template_id, category, created_at).
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from favorites_store import FAVORITES_FILE, FavoritesStore
+from generator import TEMPLATES_FILE, IdeaGenerator, flatten_templates, load_templates
+from records import IdeaRecord
+
+# --- Constants ---
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_MAX_CONCURRENCY = 64 # Requests handled at once; the rest wait their turn
+MAX_BODY_BYTES = 1024 * 1024
+MAX_HEADER_LINES = 100
+MAX_BATCH_KEYWORDS = 1000
+EXPORT_CHUNK_SIZE = 500 # Favorites written per chunk of a streamed export
+
+
+class HTTPError(Exception):
+    """Raised by handlers to send an error response."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# --- Executor Workers (run in the generation executor) ---
+_worker_generator = None
+_worker_lock = threading.Lock()
+
+
+def _init_worker(templates):
+    """Builds the process's generator once; thread-pool workers all share it."""
+    global _worker_generator
+    with _worker_lock:
+        if _worker_generator is None:
+            _worker_generator = IdeaGenerator(templates)
+
+
+def _generate_in_worker(keyword):
+    return _worker_generator.generate(keyword)
+
+
+def _generate_batch_in_worker(keywords):
+    return {keyword: _worker_generator.generate(keyword) for keyword in keywords}
+
+
+# --- Request Parsing ---
+class Request:
+    def __init__(self, method, target, version, headers, body):
+        self.method = method
+        parts = urlsplit(target)
+        self.path = parts.path.rstrip('/') or '/'
+        self.query = parse_qs(parts.query)
+        self.version = version
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self):
+        connection = self.headers.get('connection', '').lower()
+        if self.version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+        return connection != 'close'
+
+    def json(self):
+        try:
+            data = json.loads(self.body or b'{}')
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid JSON body: {e}")
+        if not isinstance(data, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "JSON body must be an object.")
+        return data
+
+
+async def _readline(reader, too_long_status):
+    """Reads one line, turning a line longer than the stream limit into ``too_long_status``."""
+    try:
+        return await reader.readline()
+    except (ValueError, asyncio.LimitOverrunError): # readline reports an overrun as ValueError
+        raise HTTPError(too_long_status, "Line too long.")
+
+
+async def _read_request(reader):
+    """Reads one request from the stream. Returns None when the client closed the connection."""
+    request_line = await _readline(reader, HTTPStatus.REQUEST_URI_TOO_LONG)
+    if not request_line.strip():
+        return None
+    try:
+        method, target, version = request_line.decode('latin-1').split()
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await _readline(reader, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers.")
+
+    if 'transfer-encoding' in headers: # Only Content-Length framed bodies are supported
+        raise HTTPError(HTTPStatus.LENGTH_REQUIRED, "Transfer-Encoding request bodies are not supported; send Content-Length.")
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length.")
+    if length < 0:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length.")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large.")
+    body = await reader.readexactly(length) if length else b''
+    return Request(method.upper(), target, version, headers, body)
+
+
+# --- Response Writing ---
+def _status_line(status):
+    status = HTTPStatus(status)
+    return f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+
+
+async def _send_json(writer, status, payload, keep_alive):
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    head = (_status_line(status)
+            + "Content-Type: application/json; charset=utf-8\r\n"
+            + f"Content-Length: {len(body)}\r\n"
+            + f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    writer.write(head.encode('latin-1') + body)
+    await writer.drain()
+
+
+async def _send_chunked(writer, content_type, chunks, keep_alive):
+    head = (_status_line(HTTPStatus.OK)
+            + f"Content-Type: {content_type}\r\n"
+            + "Transfer-Encoding: chunked\r\n"
+            + f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    writer.write(head.encode('latin-1'))
+    async for chunk in chunks:
+        if chunk:
+            writer.write(f"{len(chunk):X}\r\n".encode('latin-1') + chunk + b"\r\n")
+            await writer.drain() # Respect back-pressure from slow clients
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+# --- Service ---
+class IdeaService:
+    """Serves generation and favorites over HTTP on a single asyncio event loop."""
+
+    def __init__(self, templates, favorites_store, executor, workers=1,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        self.templates = templates
+        self.favorites_store = favorites_store
+        self.executor = executor
+        self.workers = workers
+        self._semaphore = asyncio.BoundedSemaphore(max_concurrency)
+        self._favorites_lock = asyncio.Lock() # The store is not thread-safe on its own
+        self._routes = {
+            ('GET', '/health'): self._health,
+            ('POST', '/generate'): self._generate,
+            ('POST', '/generate/batch'): self._generate_batch,
+            ('GET', '/favorites'): self._list_favorites,
+            ('POST', '/favorites'): self._add_favorite,
+            ('DELETE', '/favorites'): self._remove_favorite,
+            ('GET', '/export'): self._export,
+        }
+
+    # --- Connection Handling ---
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except HTTPError as e:
+                    await _send_json(writer, e.status, {"error": e.message}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                keep_alive = request.keep_alive
+                async with self._semaphore:
+                    await self._dispatch(request, writer, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass # Client went away mid-request
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _dispatch(self, request, writer, keep_alive):
+        handler = self._routes.get((request.method, request.path))
+        try:
+            if handler is None:
+                if any(path == request.path for _, path in self._routes):
+                    raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{request.method} not allowed on {request.path}.")
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {request.path}.")
+            result = await handler(request)
+        except HTTPError as e:
+            await _send_json(writer, e.status, {"error": e.message}, keep_alive)
+            return
+        except Exception as e:
+            print(f"[ERROR] {request.method} {request.path} failed: {e!r}")
+            await _send_json(writer, HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error."}, keep_alive)
+            return
+
+        if isinstance(result, tuple): # (content_type, async chunk iterator)
+            await _send_chunked(writer, result[0], result[1], keep_alive)
+        else:
+            await _send_json(writer, HTTPStatus.OK, result, keep_alive)
+
+    # --- Helpers ---
+    def _require_text(self, data, field):
+        value = data.get(field)
+        if not isinstance(value, str) or not value.strip():
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"'{field}' must be a non-empty string.")
+        return value.strip()
+
+    async def _run_generation(self, func, arg):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, arg)
+
+    async def _favorites_call(self, func, *args):
+        async with self._favorites_lock:
+            return await asyncio.to_thread(func, *args)
+
+    # --- Handlers ---
+    async def _health(self, request):
+        return {"status": "ok", "templates": len(self.templates)}
+
+    async def _generate(self, request):
+        keyword = self._require_text(request.json(), 'keyword')
+        ideas = await self._run_generation(_generate_in_worker, keyword)
+        return {"keyword": keyword, "ideas": [record.to_dict() for record in ideas]}
+
+    async def _generate_batch(self, request):
+        keywords = request.json().get('keywords')
+        if not isinstance(keywords, list) or not keywords:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "'keywords' must be a non-empty list.")
+        if len(keywords) > MAX_BATCH_KEYWORDS:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"At most {MAX_BATCH_KEYWORDS} keywords per batch.")
+        for index, keyword in enumerate(keywords):
+            if not isinstance(keyword, str) or not keyword.strip():
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"'keywords[{index}]' must be a non-empty string.")
+        keywords = list(dict.fromkeys(keyword.strip() for keyword in keywords))
+
+        # One executor task per worker keeps per-task overhead low for large batches
+        chunks = [keywords[i::self.workers] for i in range(min(self.workers, len(keywords)))]
+        results = {}
+        for partial in await asyncio.gather(*(self._run_generation(_generate_batch_in_worker, c) for c in chunks)):
+            results.update(partial)
+        return {"results": {keyword: [record.to_dict() for record in results[keyword]] for keyword in keywords}}
+
+    async def _list_favorites(self, request):
+        await self._favorites_call(self.favorites_store.refresh_if_changed)
+        return {"favorites": [record.to_dict() for record in self.favorites_store.items]}
+
+    def _require_record(self, data):
+        idea = data.get('idea')
+        if isinstance(idea, dict):
+            try:
+                record = IdeaRecord.from_json(idea)
+            except (TypeError, ValueError) as e:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid idea record: {e}")
+            if record.text.strip():
+                return record
+        return IdeaRecord(self._require_text(data, 'idea'))
+
+    async def _add_favorite(self, request):
+        record = self._require_record(request.json())
+        added = await self._favorites_call(self.favorites_store.add, record)
+        return {"idea": record.to_dict(), "added": added}
+
+    async def _remove_favorite(self, request):
+        record = self._require_record(request.json())
+        # Report the stored record (with its provenance) when the request only named the text
+        stored = next((item for item in self.favorites_store.items if item == record), record)
+        removed = await self._favorites_call(self.favorites_store.remove, record)
+        return {"idea": stored.to_dict(), "removed": removed}
+
+    async def _export(self, request):
+        export_format = request.query.get('format', ['ndjson'])[0]
+        if export_format not in ('ndjson', 'text'):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "'format' must be 'ndjson' or 'text'.")
+        await self._favorites_call(self.favorites_store.refresh_if_changed)
+        snapshot = list(self.favorites_store.items)
+
+        async def chunks():
+            for start in range(0, len(snapshot), EXPORT_CHUNK_SIZE):
+                batch = snapshot[start:start + EXPORT_CHUNK_SIZE]
+                if export_format == 'ndjson':
+                    lines = (json.dumps(record.to_dict(), ensure_ascii=False) for record in batch)
+                else:
+                    lines = (record.text.replace('\n', ' ') for record in batch)
+                yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+        content_type = 'application/x-ndjson' if export_format == 'ndjson' else 'text/plain; charset=utf-8'
+        return content_type, chunks()
+
+
+# --- Entry Point ---
+def _make_executor(kind, workers, templates):
+    if kind == 'thread':
+        return ThreadPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(templates,))
+    # 'spawn' so workers never inherit the listening socket (forked ones would keep the port bound)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                               initializer=_init_worker, initargs=(templates,))
+
+
+async def serve(host, port, service):
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"Serving on http://{host}:{port} ({len(service.templates)} templates, "
+          f"{service.workers} {type(service.executor).__name__} workers)")
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, server.close)
+    except (NotImplementedError, AttributeError):
+        pass # Not supported on Windows event loops
+    async with server:
+        try:
+            await server.serve_forever()
+        except asyncio.CancelledError:
+            pass # server.close() from SIGTERM
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="Content Idea Generator HTTP service")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--executor", choices=("process", "thread"), default="process",
+                        help="Where CPU-bound generation runs (default: process)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY)
+    parser.add_argument("--templates", default=TEMPLATES_FILE)
+    parser.add_argument("--favorites", default=FAVORITES_FILE)
+    return parser
+
+
+def main(argv=None):
+    args = build_arg_parser().parse_args(argv)
+    templates = flatten_templates(load_templates(args.templates))
+    favorites_store = FavoritesStore(args.favorites)
+    favorites_store.load()
+    executor = _make_executor(args.executor, args.workers, templates)
+    service = IdeaService(templates, favorites_store, executor, args.workers, args.max_concurrency)
+    try:
+        asyncio.run(serve(args.host, args.port, service))
+    except KeyboardInterrupt:
+        print("Shutting down.")
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+if __name__ == "__main__":
+    main()
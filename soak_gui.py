@@ -0,0 +1,146 @@
+# soak_gui.py
+"""Headless soak test: repeated generate / favorite / clear cycles through the real GUI handlers.
+
+Usage: python soak_gui.py [--cycles 1000] [--max-growth-kb 256] [--max-bytes-per-cycle 64]
+Runs main.py against headless_ctk, tracks Python memory with tracemalloc and
+live widget counts, and exits with status 1 if either keeps growing or any
+error dialog was raised. Memory fails on total growth past the cap, or when
+the trend across the per-100-cycle samples shows a steady per-cycle leak.
+"""
+import argparse
+import contextlib
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import headless_ctk
+
+# --- Constants ---
+WARMUP_CYCLES = 50 # Lets caches and the keyword history reach their steady size first
+SAMPLE_EVERY = 100
+MAX_BYTES_PER_CYCLE = 64 # Steady growth above this (fitted across the samples) counts as a leak
+TREND_MIN_SAMPLES = 3 # Fewer points than this give too noisy a slope to fail on
+KEYWORDS = [f"keyword {i}" for i in range(20)]
+
+
+def _first_frame(parent):
+    """Returns the first row frame in a list frame (skipping e.g. a 'No favorites' label)."""
+    for child in parent.winfo_children():
+        if isinstance(child, headless_ctk.CTkFrame):
+            return child
+    raise AssertionError(f"No row frames in {type(parent).__name__}")
+
+
+def run_cycle(app, i):
+    """One editor round-trip: generate, star the first idea, un-star it, clear."""
+    keyword = KEYWORDS[i % len(KEYWORDS)]
+    if i % 10 == 0: # Every tenth cycle types the keyword in live mode instead
+        app.live_switch.select()
+        app.keyword_entry.type_text(keyword)
+        app.advance(500) # Debounce, preview and incremental fill
+        app.live_switch.deselect()
+    else:
+        app.keyword_entry.insert(0, keyword)
+        app.generate_button.invoke()
+
+    idea_frame = _first_frame(app.output_scrollable_frame)
+    fav_button = idea_frame.winfo_children()[1].winfo_children()[0]
+    fav_button.invoke()
+    favorite_frame = _first_frame(app.favorites_scrollable_frame)
+    remove_button = favorite_frame.winfo_children()[1]
+    remove_button.invoke()
+
+    app.clear_button.invoke()
+    app.advance(100) # Lets pending after() work (favorites polling etc.) run
+
+
+def growth_per_cycle(samples):
+    """Least-squares slope of the memory samples, in bytes per cycle.
+
+    The first sample still includes allocations settling after warm-up, so it
+    is left out; with fewer than TREND_MIN_SAMPLES after that the trend is 0.
+    """
+    samples = samples[1:]
+    if len(samples) < TREND_MIN_SAMPLES:
+        return 0.0
+    xs = [(i + 2) * SAMPLE_EVERY for i in range(len(samples))]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(samples) / len(samples)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, samples))
+    return covariance / sum((x - mean_x) ** 2 for x in xs)
+
+
+def soak(cycles, max_growth_kb, max_bytes_per_cycle=MAX_BYTES_PER_CYCLE):
+    app_module = headless_ctk.load_app()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        app = app_module.IdeaGeneratorApp()
+        app.advance(1000) # Background keyword-history load and first favorites poll
+        time.sleep(0.1)
+        for i in range(WARMUP_CYCLES):
+            run_cycle(app, i)
+
+        gc.collect()
+        tracemalloc.start()
+        baseline_bytes = tracemalloc.get_traced_memory()[0]
+        baseline_widgets = headless_ctk.stats.live()
+        samples = []
+        started = time.perf_counter()
+        for i in range(cycles):
+            run_cycle(app, WARMUP_CYCLES + i)
+            if (i + 1) % SAMPLE_EVERY == 0:
+                gc.collect()
+                samples.append(tracemalloc.get_traced_memory()[0] - baseline_bytes)
+        elapsed = time.perf_counter() - started
+        gc.collect()
+        growth_bytes = tracemalloc.get_traced_memory()[0] - baseline_bytes
+        top_growth = tracemalloc.take_snapshot().statistics("lineno")[:5]
+        tracemalloc.stop()
+
+    final_widgets = headless_ctk.stats.live()
+    leaked = {name: final_widgets.get(name, 0) - baseline_widgets.get(name, 0)
+              for name in set(final_widgets) | set(baseline_widgets)
+              if final_widgets.get(name, 0) != baseline_widgets.get(name, 0)}
+    errors = app_module.messagebox.errors()
+
+    print(f"{cycles} cycles in {elapsed:.1f}s ({elapsed / cycles * 1000:.2f}ms per cycle under tracemalloc)")
+    print("Memory growth per 100 cycles (KB): " + ", ".join(f"{s / 1024:.1f}" for s in samples))
+    slope = growth_per_cycle(samples)
+    print(f"Total growth: {growth_bytes / 1024:.1f}KB (limit {max_growth_kb}KB)")
+    print(f"Growth trend: {slope:.1f} bytes per cycle (limit {max_bytes_per_cycle})")
+    print(f"Live widgets: {sum(final_widgets.values())} (baseline {sum(baseline_widgets.values())}); leaked: {leaked or 'none'}")
+    print("Widget totals: " + ", ".join(
+        f"{name} {info['created']}/{info['destroyed']} ({info['create_ms']:.0f}ms create)"
+        for name, info in headless_ctk.stats.summary().items()
+    ))
+    if errors:
+        print(f"Error dialogs: {errors[:3]}")
+
+    growing = growth_bytes > max_growth_kb * 1024 or slope > max_bytes_per_cycle
+    failed = growing or leaked or errors
+    if growing:
+        print("Largest allocations since baseline:")
+        for stat in top_growth:
+            print(f"  {stat}")
+    app.destroy()
+    return not failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=1000)
+    parser.add_argument("--max-growth-kb", type=int, default=256)
+    parser.add_argument("--max-bytes-per-cycle", type=float, default=MAX_BYTES_PER_CYCLE)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir) # Keep the app's favorites and history files out of the working tree
+        try:
+            ok = soak(args.cycles, args.max_growth_kb, args.max_bytes_per_cycle)
+        finally:
+            os.chdir(cwd)
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
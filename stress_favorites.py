@@ -0,0 +1,67 @@
+# stress_favorites.py
+"""Stress test: several processes starring favorites in the same file at once.
+
+Usage: python stress_favorites.py [--processes N] [--per-process M]
+Exits with status 1 if any favorite was lost or a removed one came back.
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from favorites_store import FavoritesStore
+from records import IdeaRecord
+
+
+def _worker(filepath, worker_id, count, start_event):
+    store = FavoritesStore(filepath)
+    store.load()
+    start_event.wait()
+    for i in range(count):
+        store.add(IdeaRecord(f"worker {worker_id} idea {i}", keyword=f"worker {worker_id}"))
+        # Star and un-star a throwaway idea to interleave removals with additions
+        scratch = IdeaRecord(f"worker {worker_id} scratch {i}")
+        store.add(scratch)
+        store.remove(scratch)
+
+
+def run(processes, per_process, filepath):
+    start_event = multiprocessing.Event()
+    workers = [
+        multiprocessing.Process(target=_worker, args=(filepath, w, per_process, start_event))
+        for w in range(processes)
+    ]
+    for p in workers:
+        p.start()
+    started = time.perf_counter()
+    start_event.set()
+    for p in workers:
+        p.join()
+    elapsed = time.perf_counter() - started
+
+    failed_workers = [p.exitcode for p in workers if p.exitcode != 0]
+    expected = {f"worker {w} idea {i}" for w in range(processes) for i in range(per_process)}
+    actual = [record.text for record in FavoritesStore(filepath).load()]
+    missing = expected - set(actual)
+    unexpected = set(actual) - expected
+    duplicates = len(actual) - len(set(actual))
+
+    print(f"{processes} processes x {per_process} favorites in {elapsed:.2f}s "
+          f"({processes * per_process * 3 / elapsed:.0f} ops/s)")
+    print(f"Expected {len(expected)}, found {len(actual)}; missing={len(missing)} "
+          f"unexpected={len(unexpected)} duplicates={duplicates} failed_workers={len(failed_workers)}")
+    return not (missing or unexpected or duplicates or failed_workers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--per-process", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ok = run(args.processes, args.per_process, os.path.join(tmp_dir, "favorites.json"))
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
@@ -7,10 +7,11 @@ import random
 import pyperclip  # For clipboard functionality
 import tkinter  # Explicitly import tkinter for messagebox parent
 from tkinter import messagebox # Use standard tkinter messagebox
+from favorites_store import FAVORITES_FILE, FavoritesStore
+from records import IdeaRecord
 
 # --- Constants ---
 TEMPLATES_FILE = 'templates.json'
-FAVORITES_FILE = 'favorites.json'
 DEFAULT_NUMBER = 5 # Default number for listicles etc.
 
 # --- Default Templates Structure (Used as fallback and for initial creation) ---
@@ -56,7 +57,13 @@ class IdeaGeneratorApp(ctk.CTk):
         print("[DEBUG] Loading templates...")
         self.templates = self._load_json_data(TEMPLATES_FILE, default_data=DEFAULT_TEMPLATES)
         print("[DEBUG] Loading favorites...")
-        self.favorites = self._load_json_data(FAVORITES_FILE, default_data=[])
+        self.favorites_store = FavoritesStore(FAVORITES_FILE)
+        self.favorites = self.favorites_store.items # IdeaRecords, shared with main.py through the same locked store
+        try:
+            self.favorites_store.load()
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Error loading {FAVORITES_FILE}: {e}")
+            messagebox.showerror("File Load Error", f"Error loading {os.path.basename(FAVORITES_FILE)}:\n{e}")
         print("[DEBUG] Flattening templates...")
         self.all_template_strings = self._flatten_templates(self.templates)
 
@@ -145,23 +152,6 @@ class IdeaGeneratorApp(ctk.CTk):
              messagebox.showerror("File Load Error", f"Unexpected error loading {os.path.basename(filepath)}:\n{e}\nUsing default data.", parent=parent)
              return json.loads(json.dumps(effective_default)) # Return copy of default
 
-    def _save_json_data(self, filepath, data):
-        absolute_path = os.path.abspath(filepath)
-        print(f"[DEBUG] Attempting to save data to: {absolute_path}")
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"[DEBUG] Successfully saved data to {filepath}.")
-            return True
-        except (IOError, TypeError) as e:
-            print(f"[ERROR] Error saving {filepath}: {e}")
-            messagebox.showerror("File Save Error", f"Error saving {os.path.basename(filepath)}:\n{e}", parent=self)
-            return False
-        except Exception as e:
-            print(f"[ERROR] Unexpected error saving {filepath}: {e}")
-            messagebox.showerror("File Save Error", f"Unexpected error saving {os.path.basename(filepath)}:\n{e}", parent=self)
-            return False
-
     def _flatten_templates(self, template_data):
         print("[DEBUG] Flattening templates...")
         flat_list = []
@@ -285,13 +275,14 @@ class IdeaGeneratorApp(ctk.CTk):
             idea_frame.pack(fill="x", pady=2, padx=5)
             idea_frame.grid_columnconfigure(0, weight=1)
             display_text = str(idea_text)
+            record = IdeaRecord(display_text, self.keyword_entry.get().strip() or None)
             idea_label = ctk.CTkLabel(idea_frame, text=display_text, wraplength=550, justify="left", anchor="w")
             idea_label.grid(row=0, column=0, padx=(5, 10), pady=2, sticky="ew")
             button_frame = ctk.CTkFrame(idea_frame, fg_color="transparent")
             button_frame.grid(row=0, column=1, padx=(0, 5), pady=2, sticky="e")
             fav_button = ctk.CTkButton(
                 button_frame, text="⭐", width=30,
-                command=lambda t=display_text: self._add_to_favorites(t)
+                command=lambda r=record: self._add_to_favorites(r)
             )
             fav_button.pack(side=tkinter.LEFT, padx=(0, 5))
             copy_button = ctk.CTkButton(
@@ -302,59 +293,51 @@ class IdeaGeneratorApp(ctk.CTk):
         except Exception as e:
             print(f"[ERROR] Failed to create widget for idea '{str(idea_text)[:50]}...': {e}")
 
-    def _add_favorite_widget(self, parent_frame, idea_text):
-        print(f"  [DEBUG] Adding favorite widget for: '{str(idea_text)[:50]}...'")
+    def _add_favorite_widget(self, parent_frame, record):
+        print(f"  [DEBUG] Adding favorite widget for: '{record.text[:50]}...'")
         try:
             fav_frame = ctk.CTkFrame(parent_frame, fg_color="transparent")
             fav_frame.pack(fill="x", pady=2, padx=5)
             fav_frame.grid_columnconfigure(0, weight=1)
-            display_text = str(idea_text)
-            fav_label = ctk.CTkLabel(fav_frame, text=display_text, wraplength=550, justify="left", anchor="w")
+            fav_label = ctk.CTkLabel(fav_frame, text=record.text, wraplength=550, justify="left", anchor="w")
             fav_label.grid(row=0, column=0, padx=(5, 10), pady=2, sticky="ew")
             remove_button = ctk.CTkButton(
                 fav_frame, text="❌", width=30, fg_color="grey",
-                command=lambda t=display_text: self._remove_from_favorites(t)
+                command=lambda r=record: self._remove_from_favorites(r)
             )
             remove_button.grid(row=0, column=1, padx=(0, 5), pady=2, sticky="e")
         except Exception as e:
-             print(f"[ERROR] Failed to create favorite widget for idea '{str(idea_text)[:50]}...': {e}")
-
-    def _add_to_favorites(self, idea_text):
-        print(f"[DEBUG] Attempting to add to favorites: '{str(idea_text)[:50]}...'")
-        idea_str = str(idea_text)
-        self.favorites = [str(fav) for fav in self.favorites if isinstance(fav, str) and fav is not None]
-        if idea_str not in self.favorites:
-            self.favorites.append(idea_str)
-            if self._save_json_data(FAVORITES_FILE, self.favorites):
-                self._update_status(f"'{idea_str[:30]}...' added to favorites.")
-                self._display_favorites()
-            else:
-                self._update_status("Error saving favorites.")
-                try: self.favorites.remove(idea_str)
-                except ValueError: pass
+             print(f"[ERROR] Failed to create favorite widget for idea '{record.text[:50]}...': {e}")
+
+    def _add_to_favorites(self, record):
+        print(f"[DEBUG] Attempting to add to favorites: '{record.text[:50]}...'")
+        try:
+            added = self.favorites_store.add(record)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Error saving {FAVORITES_FILE}: {e}")
+            messagebox.showerror("File Save Error", f"Error saving {os.path.basename(FAVORITES_FILE)}:\n{e}", parent=self)
+            self._update_status("Error saving favorites.")
+            return
+        if added:
+            self._update_status(f"'{record.text[:30]}...' added to favorites.")
         else:
             self._update_status("Already in favorites.")
+        self._display_favorites()
 
-    def _remove_from_favorites(self, idea_text):
-        print(f"[DEBUG] Attempting to remove from favorites: '{str(idea_text)[:50]}...'")
-        idea_str = str(idea_text)
-        self.favorites = [str(fav) for fav in self.favorites if isinstance(fav, str) and fav is not None]
-        if idea_str in self.favorites:
-            original_favorites = list(self.favorites)
-            try:
-                self.favorites.remove(idea_str)
-                if self._save_json_data(FAVORITES_FILE, self.favorites):
-                    self._update_status(f"Removed '{idea_str[:30]}...' from favorites.")
-                    self._display_favorites()
-                else:
-                    self._update_status("Error saving favorites after removal.")
-                    self.favorites = original_favorites
-            except ValueError:
-                 print("[ERROR] Item disappeared from favorites list before removal.")
-                 self._update_status("Error removing favorite (not found).")
-                 self.favorites = original_favorites
+    def _remove_from_favorites(self, record):
+        print(f"[DEBUG] Attempting to remove from favorites: '{record.text[:50]}...'")
+        try:
+            removed = self.favorites_store.remove(record)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Error saving {FAVORITES_FILE}: {e}")
+            messagebox.showerror("File Save Error", f"Error saving {os.path.basename(FAVORITES_FILE)}:\n{e}", parent=self)
+            self._update_status("Error saving favorites after removal.")
+            return
+        if removed:
+            self._update_status(f"Removed '{record.text[:30]}...' from favorites.")
         else:
-             self._update_status("Item not found in favorites.")
+            self._update_status("Item not found in favorites.")
+        self._display_favorites()
 
     def _copy_to_clipboard(self, text):
         print(f"[DEBUG] Attempting to copy: '{str(text)[:50]}...'")
@@ -395,9 +378,8 @@ class IdeaGeneratorApp(ctk.CTk):
                 widget.destroy()
             if self.favorites:
                 print(f"[DEBUG] Found {len(self.favorites)} favorites to display.")
-                valid_favorites = [str(fav) for fav in self.favorites if fav is not None]
-                for i, fav_text in enumerate(reversed(valid_favorites)):
-                    self._add_favorite_widget(self.favorites_scrollable_frame, fav_text)
+                for i, record in enumerate(reversed(self.favorites)):
+                    self._add_favorite_widget(self.favorites_scrollable_frame, record)
             else:
                 print("[DEBUG] No favorites found to display.")
                 no_favs_label = ctk.CTkLabel(self.favorites_scrollable_frame, text="No favorites saved yet.")